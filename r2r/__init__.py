@@ -1,3 +1,4 @@
+import importlib
 import logging
 
 # Keep '*' imports for enhanced development velocity
@@ -9,7 +10,15 @@ from .main import *
 from .parsers import *
 from .pipelines import *
 from .pipes import *
-from .providers import *
+
+
+def __getattr__(name: str):
+    # Providers are imported on first access, see `r2r.providers`
+    providers = importlib.import_module(".providers", __name__)
+    if name in providers.__all__:
+        return getattr(providers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 logger = logging.getLogger("r2r")
 logger.setLevel(logging.INFO)
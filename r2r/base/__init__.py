@@ -84,6 +84,8 @@ from .utils import (
     RecursiveCharacterTextSplitter,
     Relation,
     TextSplitter,
+    bounded_gather,
+    buffered_async_generator,
     format_entity_types,
     format_relations,
     generate_id_from_label,
@@ -192,6 +194,8 @@ __all__ = [
     "TextSplitter",
     "RecursiveCharacterTextSplitter",
     "to_async_generator",
+    "buffered_async_generator",
+    "bounded_gather",
     "EntityType",
     "Relation",
     "format_entity_types",
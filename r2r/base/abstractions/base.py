@@ -1,16 +1,53 @@
 import asyncio
+import inspect
+import threading
 
 
 class AsyncSyncMeta(type):
     _event_loop = None  # Class-level shared event loop
+    _loop_thread = None
+    _loop_lock = threading.Lock()
+
+    @staticmethod
+    def _new_event_loop():
+        # uvloop is optional; uvicorn already picks it up for the server loop
+        try:
+            import uvloop
+
+            return uvloop.new_event_loop()
+        except ImportError:
+            return asyncio.new_event_loop()
 
     @classmethod
     def get_event_loop(cls):
-        if cls._event_loop is None or cls._event_loop.is_closed():
-            cls._event_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(cls._event_loop)
+        # Sync wrappers share one loop, run forever on a daemon thread, rather
+        # than building and tearing down a loop and thread on every call
+        with cls._loop_lock:
+            if cls._event_loop is None or cls._event_loop.is_closed():
+                cls._event_loop = cls._new_event_loop()
+                cls._loop_thread = threading.Thread(
+                    target=cls._event_loop.run_forever,
+                    name="AsyncSyncMeta-loop",
+                    daemon=True,
+                )
+                cls._loop_thread.start()
         return cls._event_loop
 
+    @classmethod
+    def iterate_sync(cls, async_gen):
+        """Drive an async generator on the shared loop, yielding items synchronously."""
+        loop = cls.get_event_loop()
+        try:
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(
+                        async_gen.__anext__(), loop
+                    ).result()
+                except StopAsyncIteration:
+                    return
+        finally:
+            asyncio.run_coroutine_threadsafe(async_gen.aclose(), loop).result()
+
     def __new__(cls, name, bases, dct):
         new_cls = super().__new__(cls, name, bases, dct)
         for attr_name, attr_value in dct.items():
@@ -24,49 +61,14 @@ class AsyncSyncMeta(type):
 
                 def make_sync_method(async_method):
                     def sync_wrapper(self, *args, **kwargs):
-                        loop = cls.get_event_loop()
-                        if not loop.is_running():
-                            # Setup to run the loop in a background thread if necessary
-                            # to prevent blocking the main thread in a synchronous call environment
-                            from threading import Thread
-
-                            result = None
-                            exception = None
-
-                            def run():
-                                nonlocal result, exception
-                                try:
-                                    asyncio.set_event_loop(loop)
-                                    result = loop.run_until_complete(
-                                        async_method(self, *args, **kwargs)
-                                    )
-                                except Exception as e:
-                                    exception = e
-                                finally:
-                                    generation_config = kwargs.get(
-                                        "rag_generation_config", None
-                                    )
-                                    if (
-                                        not generation_config
-                                        or not generation_config.stream
-                                    ):
-                                        loop.run_until_complete(
-                                            loop.shutdown_asyncgens()
-                                        )
-                                        loop.close()
-
-                            thread = Thread(target=run)
-                            thread.start()
-                            thread.join()
-                            if exception:
-                                raise exception
-                            return result
-                        else:
-                            # If there's already a running loop, schedule and execute the coroutine
-                            future = asyncio.run_coroutine_threadsafe(
-                                async_method(self, *args, **kwargs), loop
-                            )
-                            return future.result()
+                        result = asyncio.run_coroutine_threadsafe(
+                            async_method(self, *args, **kwargs),
+                            cls.get_event_loop(),
+                        ).result()
+                        if inspect.isasyncgen(result):
+                            # Streaming results are produced on the shared loop
+                            return cls.iterate_sync(result)
+                        return result
 
                     return sync_wrapper
 
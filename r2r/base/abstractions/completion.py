@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .search import AggregateSearchResult
 
@@ -27,7 +27,7 @@ class MessageType(Enum):
 class CompletionRecord(BaseModel):
     message_id: uuid.UUID
     message_type: MessageType
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     feedback: Optional[List[str]] = None
     score: Optional[List[float]] = None
     completion_start_time: Optional[datetime] = None
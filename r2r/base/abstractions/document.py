@@ -2,6 +2,8 @@
 
 import json
 import logging
+import re
+import sys
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -13,6 +15,11 @@ logger = logging.getLogger(__name__)
 
 DataType = Union[str, bytes]
 
+# Matches entity entries of the form `[label], category[:subcategory]:value`
+_ENTITY_PATTERN = re.compile(
+    r"^(.*?\]), ([^:]*):(?:([^:]*):)?(.*)$", re.DOTALL
+)
+
 
 class DocumentType(str, Enum):
     """Types of documents that can be stored."""
@@ -151,6 +158,9 @@ class Entity(BaseModel):
     subcategory: Optional[str] = None
     value: str
 
+    class Config:
+        frozen = True
+
     def __str__(self):
         return (
             f"{self.category}:{self.subcategory}:{self.value}"
@@ -166,35 +176,30 @@ class Triple(BaseModel):
     predicate: str
     object: str
 
+    class Config:
+        frozen = True
+
 
 def extract_entities(llm_payload: list[str]) -> dict[str, Entity]:
     entities = {}
     for entry in llm_payload:
-        try:
-            if "], " in entry:  # Check if the entry is an entity
-                entry_val = entry.split("], ")[0] + "]"
-                entry = entry.split("], ")[1]
-                colon_count = entry.count(":")
-
-                if colon_count == 1:
-                    category, value = entry.split(":")
-                    subcategory = None
-                elif colon_count >= 2:
-                    parts = entry.split(":", 2)
-                    category, subcategory, value = (
-                        parts[0],
-                        parts[1],
-                        parts[2],
-                    )
-                else:
-                    raise ValueError("Unexpected entry format")
-
-                entities[entry_val] = Entity(
-                    category=category, subcategory=subcategory, value=value
-                )
-        except Exception as e:
-            logger.error(f"Error processing entity {entry}: {e}")
+        if "], " not in entry:  # Check if the entry is an entity
+            continue
+        match = _ENTITY_PATTERN.match(entry)
+        if match is None:
+            logger.error(
+                f"Error processing entity {entry}: Unexpected entry format"
+            )
             continue
+        entry_val, category, subcategory, value = match.groups()
+        # Categories come from a small vocabulary, so share one copy of each
+        category = sys.intern(category)
+        if subcategory is not None:
+            subcategory = sys.intern(subcategory)
+        # Fields come straight from the pattern groups, so skip validation
+        entities[entry_val] = Entity.model_construct(
+            category=category, subcategory=subcategory, value=value
+        )
     return entities
 
 
@@ -203,21 +208,26 @@ def extract_triples(
 ) -> list[Triple]:
     triples = []
     for entry in llm_payload:
+        if "], " in entry:  # Skip entity entries
+            continue
+        subject, _, remainder = entry.partition(" ")
+        predicate, _, object = remainder.partition(" ")
         try:
-            if "], " not in entry:  # Check if the entry is an entity
-                elements = entry.split(" ")
-                subject = elements[0]
-                predicate = elements[1]
-                object = " ".join(elements[2:])
-                subject = entities[subject].value  # Use entity.value
-                if "[" in object and "]" in object:
-                    object = entities[object].value  # Use entity.value
-                triples.append(
-                    Triple(subject=subject, predicate=predicate, object=object)
-                )
-        except Exception as e:
+            if not predicate:
+                raise ValueError("Unexpected entry format")
+            subject = entities[subject].value  # Use entity.value
+            if object.startswith("[") and object.endswith("]"):
+                object = entities[object].value  # Use entity.value
+        except (KeyError, ValueError) as e:
             logger.error(f"Error processing triplet {entry}: {e}")
             continue
+        triples.append(
+            Triple.model_construct(
+                subject=subject,
+                predicate=sys.intern(predicate),
+                object=object,
+            )
+        )
     return triples
 
 
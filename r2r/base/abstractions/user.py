@@ -48,12 +48,16 @@ class UserResponse(UserBase):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class Token(BaseModel):
     token: str
     token_type: str
 
+    class Config:
+        frozen = True
+
 
 class TokenData(BaseModel):
     email: Optional[str] = None
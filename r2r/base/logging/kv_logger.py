@@ -1,12 +1,13 @@
+import asyncio
 import json
 import logging
 import os
+import time
 import uuid
 from abc import abstractmethod
 from datetime import datetime
 from typing import Optional
 
-import asyncpg
 from pydantic import BaseModel
 
 from ..providers.base import Provider, ProviderConfig
@@ -29,7 +30,10 @@ class LoggingConfig(ProviderConfig):
     logging_path: Optional[str] = None
 
     def validate(self) -> None:
-        pass
+        # Table names are interpolated into SQL, so only plain identifiers
+        for table in (self.log_table, self.log_info_table):
+            if not table.isidentifier():
+                raise ValueError(f"Invalid logging table name: {table!r}")
 
     @property
     def supported_providers(self) -> list[str]:
@@ -67,6 +71,22 @@ class KVLoggingProvider(Provider):
     ) -> list:
         pass
 
+    async def get_run_info_and_logs(
+        self,
+        limit: int = 10,
+        log_type_filter: Optional[str] = None,
+        limit_per_run: int = 10,
+    ) -> tuple[list[RunInfo], list]:
+        run_info = await self.get_run_info(
+            limit, log_type_filter=log_type_filter
+        )
+        if not run_info:
+            return run_info, []
+        logs = await self.get_logs(
+            [run.run_id for run in run_info], limit_per_run
+        )
+        return run_info, logs
+
     @abstractmethod
     async def score_completion(
         self, log_id: uuid.UUID, message_id: uuid.UUID, score: float
@@ -76,6 +96,7 @@ class KVLoggingProvider(Provider):
 
 class LocalKVLoggingProvider(KVLoggingProvider):
     def __init__(self, config: LoggingConfig):
+        config.validate()
         self.log_table = config.log_table
         self.log_info_table = config.log_info_table
         self.logging_path = config.logging_path or os.getenv(
@@ -86,6 +107,8 @@ class LocalKVLoggingProvider(KVLoggingProvider):
                 "Please set the environment variable LOCAL_DB_PATH."
             )
         self.conn = None
+        self._pending_logs: list[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
         try:
             import aiosqlite
 
@@ -96,7 +119,25 @@ class LocalKVLoggingProvider(KVLoggingProvider):
             )
 
     async def init(self):
-        self.conn = await self.aiosqlite.connect(self.logging_path)
+        # Write transactions take the write lock up front (BEGIN IMMEDIATE)
+        # rather than upgrading mid-transaction and failing with SQLITE_BUSY
+        self.conn = self.aiosqlite.connect(
+            self.logging_path,
+            cached_statements=256,
+            isolation_level="IMMEDIATE",
+        )
+        # The connection is shared for the life of the process, so its worker
+        # thread must not keep the interpreter alive at exit
+        self.conn.daemon = True
+        await self.conn
+        # WAL turns each commit into a single log append and lets readers run
+        # alongside the writer; NORMAL sync is durable across app crashes.
+        await self.conn.execute("PRAGMA journal_mode=WAL")
+        await self.conn.execute("PRAGMA synchronous=NORMAL")
+        await self.conn.execute("PRAGMA temp_store=MEMORY")
+        await self.conn.execute("PRAGMA cache_size=-64000")
+        await self.conn.execute("PRAGMA mmap_size=268435456")
+        await self.conn.execute("PRAGMA busy_timeout=5000")
         await self.conn.execute(
             f"""
             CREATE TABLE IF NOT EXISTS {self.log_table} (
@@ -118,6 +159,17 @@ class LocalKVLoggingProvider(KVLoggingProvider):
             )
         """
         )
+        # get_logs and score_completion look rows up by log_id (newest first),
+        # get_run_info filters by log_type and sorts by timestamp
+        await self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.log_table}_log_id_timestamp ON {self.log_table} (log_id, timestamp)"
+        )
+        await self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.log_info_table}_timestamp ON {self.log_info_table} (timestamp)"
+        )
+        await self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.log_info_table}_log_type_timestamp ON {self.log_info_table} (log_type, timestamp)"
+        )
         await self.conn.commit()
 
         # TODO: deprecated, remove in version 0.3.0
@@ -128,6 +180,21 @@ class LocalKVLoggingProvider(KVLoggingProvider):
         self.has_user_id = any(
             column[1].lower() == "user_id" for column in columns
         )
+        # Built once so every batch reuses the same cached prepared statement
+        if self.has_user_id:
+            self._insert_log_sql = f"INSERT INTO {self.log_table} (timestamp, log_id, key, value, user_id) VALUES (?, ?, ?, ?, ?)"
+        else:
+            self._insert_log_sql = f"INSERT INTO {self.log_table} (timestamp, log_id, key, value) VALUES (?, ?, ?, ?)"
+        self._upsert_info_sql = f"""
+            INSERT INTO {self.log_info_table} (timestamp, log_id, log_type, user_id)
+            VALUES (datetime('now'), ?, ?, ?)
+            ON CONFLICT(log_id) DO UPDATE SET
+            timestamp = datetime('now'),
+            log_type = excluded.log_type,
+            user_id = excluded.user_id
+            """
+        self._select_completion_sql = f"SELECT value FROM {self.log_table} WHERE log_id = ? AND key = 'completion_record'"
+        self._update_completion_sql = f"UPDATE {self.log_table} SET value = ? WHERE log_id = ? AND key = 'completion_record'"
 
     async def __aenter__(self):
         if self.conn is None:
@@ -139,9 +206,33 @@ class LocalKVLoggingProvider(KVLoggingProvider):
 
     async def close(self):
         if self.conn:
+            await self.flush()
             await self.conn.close()
             self.conn = None
 
+    async def flush(self):
+        """Wait until every buffered log entry has been written."""
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+    async def _write_pending_logs(self):
+        # Entries logged while a batch is being written are picked up by the
+        # next pass, so bursts share one transaction (and fsync) per batch.
+        try:
+            while self._pending_logs:
+                rows, self._pending_logs = self._pending_logs, []
+                # One clock read per batch, in the format datetime('now') used
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+                width = 4 if self.has_user_id else 3
+                rows = [(timestamp, *row[:width]) for row in rows]
+                try:
+                    await self.conn.executemany(self._insert_log_sql, rows)
+                    await self.conn.commit()
+                except Exception as e:
+                    logger.error(f"Error writing {len(rows)} log entries: {e}")
+        finally:
+            self._flush_task = None
+
     async def log(
         self,
         log_id: uuid.UUID,
@@ -150,8 +241,6 @@ class LocalKVLoggingProvider(KVLoggingProvider):
         user_id: Optional[str] = None,
         is_info_log=False,
     ):
-        collection = self.log_info_table if is_info_log else self.log_table
-
         # TODO: deprecated, remove in version 0.3.0
         if not self.has_user_id:
             # TODO: add in link to migration guide
@@ -165,20 +254,13 @@ class LocalKVLoggingProvider(KVLoggingProvider):
                 raise ValueError("Info log keys must contain the text 'type'")
             if self.has_user_id:
                 await self.conn.execute(
-                    f"""
-                    INSERT INTO {collection} (timestamp, log_id, log_type, user_id)
-                    VALUES (datetime('now'), ?, ?, ?)
-                    ON CONFLICT(log_id) DO UPDATE SET
-                    timestamp = datetime('now'),
-                    log_type = excluded.log_type,
-                    user_id = excluded.user_id
-                    """,
+                    self._upsert_info_sql,
                     (str(log_id), value, str(user_id)),
                 )
             else:
                 await self.conn.execute(
                     f"""
-                    INSERT INTO {collection} (timestamp, log_id, log_type, user_id)
+                    INSERT INTO {self.log_info_table} (timestamp, log_id, log_type, user_id)
                     VALUES (datetime('now'), ?, ?)
                     ON CONFLICT(log_id) DO UPDATE SET
                     timestamp = datetime('now'),
@@ -186,24 +268,13 @@ class LocalKVLoggingProvider(KVLoggingProvider):
                     """,
                     (str(log_id), value, str(user_id)),
                 )
-        elif self.has_user_id:
-            await self.conn.execute(
-                f"""
-                INSERT INTO {collection} (timestamp, log_id, key, value, user_id)
-                VALUES (datetime('now'), ?, ?, ?, ?)
-                """,
-                (str(log_id), key, value, str(user_id)),
-            )
+            await self.conn.commit()
         else:
-            await self.conn.execute(
-                f"""
-                INSERT INTO {collection} (timestamp, log_id, key, value)
-                VALUES (datetime('now'), ?, ?, ?)
-                """,
-                (str(log_id), key, value),
-            )
-
-        await self.conn.commit()
+            self._pending_logs.append((str(log_id), key, value, str(user_id)))
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(
+                    self._write_pending_logs()
+                )
 
     async def get_run_info(
         self,
@@ -243,15 +314,17 @@ class LocalKVLoggingProvider(KVLoggingProvider):
     ) -> list:
         if not run_ids:
             raise ValueError("No run ids provided.")
+        await self.flush()
         cursor = await self.conn.cursor()
         placeholders = ",".join(["?" for _ in run_ids])
-        query = "SELECT log_id, key, value, timestamp"
+        columns = "log_id, key, value, timestamp"
         # TODO: unnecessary to check
         if self.has_user_id:
-            query += ", user_id"
-        query += f"""
+            columns += ", user_id"
+        query = f"""
+        SELECT {columns}
         FROM (
-            SELECT *, ROW_NUMBER() OVER (PARTITION BY log_id ORDER BY timestamp DESC) as rn
+            SELECT {columns}, ROW_NUMBER() OVER (PARTITION BY log_id ORDER BY timestamp DESC) as rn
             FROM {self.log_table}
             WHERE log_id IN ({placeholders})
         )
@@ -262,19 +335,16 @@ class LocalKVLoggingProvider(KVLoggingProvider):
         params = [str(ele) for ele in run_ids] + [limit_per_run]
         await cursor.execute(query, params)
         rows = await cursor.fetchall()
-        return [
-            dict(zip([d[0] for d in cursor.description], row)) for row in rows
-        ]
+        column_names = [d[0] for d in cursor.description]
+        return [dict(zip(column_names, row)) for row in rows]
 
     async def score_completion(
         self, log_id: uuid.UUID, message_id: uuid.UUID, score: float
     ):
+        await self.flush()
         cursor = await self.conn.cursor()
 
-        await cursor.execute(
-            f"SELECT value FROM {self.log_table} WHERE log_id = ? AND key = 'completion_record'",
-            (str(log_id),),
-        )
+        await cursor.execute(self._select_completion_sql, (str(log_id),))
         row = await cursor.fetchone()
 
         if row:
@@ -298,7 +368,7 @@ class LocalKVLoggingProvider(KVLoggingProvider):
                     ]
 
                 await cursor.execute(
-                    f"UPDATE {self.log_table} SET value = ? WHERE log_id = ? AND key = 'completion_record'",
+                    self._update_completion_sql,
                     (json.dumps(completion_record), str(log_id)),
                 )
                 await self.conn.commit()
@@ -313,6 +383,7 @@ class PostgresLoggingConfig(LoggingConfig):
     log_info_table: str = "log_info"
 
     def validate(self) -> None:
+        super().validate()
         required_env_vars = [
             "POSTGRES_DBNAME",
             "POSTGRES_USER",
@@ -356,9 +427,17 @@ class PostgresKVLoggingProvider(KVLoggingProvider):
             raise ValueError(
                 "Please set the environment variable POSTGRES_PORT."
             )
+        try:
+            import asyncpg
+
+            self.asyncpg = asyncpg
+        except ImportError:
+            raise ImportError(
+                "Please install asyncpg to use the PostgresKVLoggingProvider."
+            )
 
     async def init(self):
-        self.pool = await asyncpg.create_pool(
+        self.pool = await self.asyncpg.create_pool(
             database=os.getenv("POSTGRES_DBNAME"),
             user=os.getenv("POSTGRES_USER"),
             password=os.getenv("POSTGRES_PASSWORD"),
@@ -388,6 +467,15 @@ class PostgresKVLoggingProvider(KVLoggingProvider):
                 )
             """
             )
+            await conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.log_table}_log_id_timestamp ON {self.log_table} (log_id, timestamp)"
+            )
+            await conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.log_info_table}_timestamp ON {self.log_info_table} (timestamp)"
+            )
+            await conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.log_info_table}_log_type_timestamp ON {self.log_info_table} (log_type, timestamp)"
+            )
 
             # TODO: deprecated, remove in version 0.3.0
             columns = await conn.fetch(
@@ -478,7 +566,7 @@ class PostgresKVLoggingProvider(KVLoggingProvider):
             params.append(log_type_filter)
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
-        query += " ORDER BY timestamp DESC LIMIT $2"
+        query += f" ORDER BY timestamp DESC LIMIT ${len(params) + 1}"
         params.append(limit)
         async with self.pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
@@ -511,7 +599,46 @@ class PostgresKVLoggingProvider(KVLoggingProvider):
         params = [str(run_id) for run_id in run_ids] + [limit_per_run]
         async with self.pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
-            return [{key: row[key] for key in row.keys()} for row in rows]
+            return [dict(row) for row in rows]
+
+    async def get_run_info_and_logs(
+        self,
+        limit: int = 10,
+        log_type_filter: Optional[str] = None,
+        limit_per_run: int = 10,
+    ) -> tuple[list[RunInfo], list]:
+        # The logs query selects the latest runs itself, so it does not have
+        # to wait on get_run_info and both round-trips run at once
+        params = [limit]
+        run_filter = ""
+        if log_type_filter:
+            run_filter = "WHERE log_type = $2"
+            params.append(log_type_filter)
+        query = f"""
+        SELECT * FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY log_id ORDER BY timestamp DESC) as rn
+            FROM {self.log_table}
+            WHERE log_id IN (
+                SELECT log_id FROM {self.log_info_table} {run_filter}
+                ORDER BY timestamp DESC LIMIT $1
+            )
+        ) sub
+        WHERE sub.rn <= ${len(params) + 1}
+        ORDER BY sub.timestamp DESC
+        """
+        params.append(limit_per_run)
+
+        async def fetch_logs():
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query, *params)
+                return [dict(row) for row in rows]
+
+        run_info, logs = await asyncio.gather(
+            self.get_run_info(limit, log_type_filter), fetch_logs()
+        )
+        # A run written between the two queries must not leak into the logs
+        run_ids = {run.run_id for run in run_info}
+        return run_info, [log for log in logs if log["log_id"] in run_ids]
 
     async def score_completion(
         self, log_id: uuid.UUID, message_id: uuid.UUID, score: float
@@ -594,7 +721,13 @@ class RedisKVLoggingProvider(KVLoggingProvider):
 
         cluster_ip = os.getenv("REDIS_CLUSTER_IP")
         port = os.getenv("REDIS_CLUSTER_PORT")
-        self.redis = Redis(host=cluster_ip, port=port, decode_responses=True)
+        self.redis = Redis(
+            host=cluster_ip,
+            port=port,
+            decode_responses=True,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
         self.log_key = config.log_table
         self.log_info_key = config.log_info_table
         self.has_user_id = False
@@ -653,12 +786,14 @@ class RedisKVLoggingProvider(KVLoggingProvider):
             if "type" not in key:
                 raise ValueError("Metadata keys must contain the text 'type'")
             log_entry["log_type"] = value
-            await self.redis.hset(
-                self.log_info_key, str(log_id), json.dumps(log_entry)
-            )
-            await self.redis.zadd(
-                f"{self.log_info_key}_sorted", {str(log_id): timestamp}
-            )
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    self.log_info_key, str(log_id), json.dumps(log_entry)
+                )
+                pipe.zadd(
+                    f"{self.log_info_key}_sorted", {str(log_id): timestamp}
+                )
+                await pipe.execute()
         else:
             await self.redis.lpush(
                 f"{self.log_key}:{str(log_id)}", json.dumps(log_entry)
@@ -682,10 +817,9 @@ class RedisKVLoggingProvider(KVLoggingProvider):
 
             start += count_per_batch
 
-            for log_id in log_ids:
-                log_entry = json.loads(
-                    await self.redis.hget(self.log_info_key, log_id)
-                )
+            raw_entries = await self.redis.hmget(self.log_info_key, log_ids)
+            for raw_entry in raw_entries:
+                log_entry = json.loads(raw_entry)
                 if (
                     log_type_filter
                     and log_entry["log_type"] == log_type_filter
@@ -705,11 +839,15 @@ class RedisKVLoggingProvider(KVLoggingProvider):
     async def get_logs(
         self, run_ids: list[uuid.UUID], limit_per_run: int = 10
     ) -> list:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for run_id in run_ids:
+                pipe.lrange(
+                    f"{self.log_key}:{str(run_id)}", 0, limit_per_run - 1
+                )
+            results = await pipe.execute()
+
         logs = []
-        for run_id in run_ids:
-            raw_logs = await self.redis.lrange(
-                f"{self.log_key}:{str(run_id)}", 0, limit_per_run - 1
-            )
+        for raw_logs in results:
             for raw_log in raw_logs:
                 json_log = json.loads(raw_log)
                 json_log["log_id"] = uuid.UUID(json_log["log_id"])
@@ -756,6 +894,9 @@ class RedisKVLoggingProvider(KVLoggingProvider):
 class KVLoggingSingleton:
     _instance = None
     _is_configured = False
+    _provider_task: Optional[asyncio.Task] = None
+    _provider_loop: Optional[asyncio.AbstractEventLoop] = None
+    _provider: Optional[KVLoggingProvider] = None
 
     SUPPORTED_PROVIDERS = {
         "local": LocalKVLoggingProvider,
@@ -777,6 +918,62 @@ class KVLoggingSingleton:
         else:
             raise Exception("KVLoggingSingleton is already configured.")
 
+    @classmethod
+    async def get_provider(cls) -> KVLoggingProvider:
+        """Return the shared provider, opening its connection on first use."""
+        loop = asyncio.get_running_loop()
+        provider = cls._provider
+        if provider is not None and cls._provider_loop is loop:
+            return provider
+
+        if cls._provider_task is None or cls._provider_loop is not loop:
+            # Connections and pools are bound to the loop that opened them
+            stale_task = cls._provider_task
+            cls._provider = None
+            cls._provider_loop = loop
+            cls._provider_task = loop.create_task(
+                cls._open_provider(stale_task)
+            )
+        task = cls._provider_task
+        try:
+            provider = await task
+        except Exception:
+            if cls._provider_task is task:
+                cls._provider_task = None
+            raise
+        if cls._provider_task is task:
+            cls._provider = provider
+        return provider
+
+    @classmethod
+    async def close(cls):
+        """Close the shared provider; the next call opens a fresh one."""
+        provider = cls._provider
+        cls._provider = None
+        cls._provider_task = None
+        cls._provider_loop = None
+        if provider is not None:
+            await provider.close()
+
+    @classmethod
+    async def _open_provider(
+        cls, stale_task: Optional[asyncio.Task] = None
+    ) -> KVLoggingProvider:
+        if (
+            stale_task is not None
+            and stale_task.done()
+            and not stale_task.cancelled()
+            and stale_task.exception() is None
+        ):
+            try:
+                await stale_task.result().close()
+            except Exception as e:
+                logger.warning(f"Error closing stale logging provider: {e}")
+
+        provider = cls.get_instance()
+        await provider.__aenter__()
+        return provider
+
     @classmethod
     async def log(
         cls,
@@ -787,14 +984,14 @@ class KVLoggingSingleton:
         is_info_log: bool = False,
     ):
         try:
-            async with cls.get_instance() as provider:
-                await provider.log(
-                    log_id,
-                    key,
-                    value,
-                    user_id=user_id,
-                    is_info_log=is_info_log,
-                )
+            provider = await cls.get_provider()
+            await provider.log(
+                log_id,
+                key,
+                value,
+                user_id=user_id,
+                is_info_log=is_info_log,
+            )
         except Exception as e:
             logger.error(
                 f"Error logging data {(log_id, key, value, user_id)}: {e}"
@@ -806,11 +1003,11 @@ class KVLoggingSingleton:
         limit: int = 10,
         log_type_filter: Optional[str] = None,
     ) -> list[RunInfo]:
-        async with cls.get_instance() as provider:
-            return await provider.get_run_info(
-                limit,
-                log_type_filter=log_type_filter,
-            )
+        provider = await cls.get_provider()
+        return await provider.get_run_info(
+            limit,
+            log_type_filter=log_type_filter,
+        )
 
     @classmethod
     async def get_logs(
@@ -818,12 +1015,26 @@ class KVLoggingSingleton:
         run_ids: list[uuid.UUID],
         limit_per_run: int = 10,
     ) -> list:
-        async with cls.get_instance() as provider:
-            return await provider.get_logs(run_ids, limit_per_run)
+        provider = await cls.get_provider()
+        return await provider.get_logs(run_ids, limit_per_run)
+
+    @classmethod
+    async def get_run_info_and_logs(
+        cls,
+        limit: int = 10,
+        log_type_filter: Optional[str] = None,
+        limit_per_run: int = 10,
+    ) -> tuple[list[RunInfo], list]:
+        provider = await cls.get_provider()
+        return await provider.get_run_info_and_logs(
+            limit,
+            log_type_filter=log_type_filter,
+            limit_per_run=limit_per_run,
+        )
 
     @classmethod
     async def score_completion(
         cls, log_id: uuid.UUID, message_id: uuid.UUID, score: float
     ):
-        async with cls.get_instance() as provider:
-            return await provider.score_completion(log_id, message_id, score)
+        provider = await cls.get_provider()
+        return await provider.score_completion(log_id, message_id, score)
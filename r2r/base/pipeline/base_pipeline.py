@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections.abc import AsyncIterable
 from enum import Enum
 from typing import Any, AsyncGenerator, Optional
 
@@ -10,6 +11,7 @@ from r2r.base import User
 from ..logging.kv_logger import KVLoggingSingleton
 from ..logging.run_manager import RunManager, manage_run
 from ..pipes.base_pipe import AsyncPipe, AsyncState
+from ..utils import to_async_generator
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,11 @@ class PipelineTypes(Enum):
     SEARCH = "search"
 
 
+_PIPELINE_TYPES = frozenset(
+    pipeline_type.value for pipeline_type in PipelineTypes
+)
+
+
 class AsyncPipeline:
     """Pipeline class for running a sequence of pipes."""
 
@@ -37,7 +44,6 @@ class AsyncPipeline:
         self.upstream_outputs: list[list[dict[str, str]]] = []
         self.pipe_logger = pipe_logger or KVLoggingSingleton()
         self.run_manager = run_manager or RunManager(self.pipe_logger)
-        self.futures = {}
         self.level = 0
 
     def add_pipe(
@@ -67,12 +73,10 @@ class AsyncPipeline:
         """Run the pipeline."""
         run_manager = run_manager or self.run_manager
 
-        try:
-            PipelineTypes(self.pipeline_type)
-        except ValueError as e:
+        if self.pipeline_type not in _PIPELINE_TYPES:
             raise ValueError(
                 f"Invalid pipeline type: {self.pipeline_type}, must be one of {PipelineTypes.__members__.keys()}"
-            ) from e
+            )
 
         self.state = state or AsyncState()
         current_input = input
@@ -86,9 +90,6 @@ class AsyncPipeline:
                 )
             try:
                 for pipe_num in range(len(self.pipes)):
-                    config_name = self.pipes[pipe_num].config.name
-                    self.futures[config_name] = asyncio.Future()
-
                     current_input = self._run_pipe(
                         pipe_num,
                         current_input,
@@ -96,7 +97,6 @@ class AsyncPipeline:
                         *args,
                         **kwargs,
                     )
-                    self.futures[config_name].set_result(current_input)
                 return (
                     current_input
                     if stream
@@ -109,9 +109,8 @@ class AsyncPipeline:
     async def _consume_all(self, gen: AsyncGenerator) -> list[Any]:
         result = []
         async for item in gen:
-            if hasattr(
-                item, "__aiter__"
-            ):  # Check if the item is an async generator
+            # Check if the item is a nested async stream
+            if isinstance(item, AsyncIterable):
                 sub_result = await self._consume_all(item)
                 result.extend(sub_result)
             else:
@@ -126,42 +125,23 @@ class AsyncPipeline:
         *args: Any,
         **kwargs: Any,
     ):
-        # Collect inputs, waiting for the necessary futures
         pipe = self.pipes[pipe_num]
-        add_upstream_outputs = self.sort_upstream_outputs(
-            self.upstream_outputs[pipe_num]
-        )
+        add_upstream_outputs = self.upstream_outputs[pipe_num]
         input_dict = {"message": input}
 
-        # Group upstream outputs by prev_pipe_name
-        grouped_upstream_outputs = {}
-        for upstream_input in add_upstream_outputs:
-            upstream_pipe_name = upstream_input["prev_pipe_name"]
-            if upstream_pipe_name not in grouped_upstream_outputs:
-                grouped_upstream_outputs[upstream_pipe_name] = []
-            grouped_upstream_outputs[upstream_pipe_name].append(upstream_input)
-
-        for (
-            upstream_pipe_name,
-            upstream_inputs,
-        ) in grouped_upstream_outputs.items():
-
-            async def resolve_future_output(future):
-                result = future.result()
-                # consume the async generator
-                return [item async for item in result]
-
-            async def replay_items_as_async_gen(items):
-                for item in items:
-                    yield item
-
-            temp_results = await resolve_future_output(
-                self.futures[upstream_pipe_name]
+        if add_upstream_outputs:
+            # Upstream outputs are read from the state, which is only complete
+            # once the producing pipes have finished. Draining the incoming
+            # stream once runs every preceding pipe to completion, after which
+            # the buffered items are replayed as this pipe's message.
+            input_dict["message"] = to_async_generator(
+                [item async for item in input]
             )
-            if upstream_pipe_name == self.pipes[pipe_num - 1].config.name:
-                input_dict["message"] = replay_items_as_async_gen(temp_results)
 
-            for upstream_input in upstream_inputs:
+            for upstream_input in self.sort_upstream_outputs(
+                add_upstream_outputs
+            ):
+                upstream_pipe_name = upstream_input["prev_pipe_name"]
                 outputs = await self.state.get(upstream_pipe_name, "output")
                 prev_output_field = upstream_input.get(
                     "prev_output_field", None
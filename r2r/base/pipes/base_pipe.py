@@ -112,11 +112,11 @@ class AsyncPipe:
         return self._type
 
     async def log_worker(self):
+        log_queue, log = self.log_queue, self.pipe_logger.log
         while True:
-            log_data = await self.log_queue.get()
-            run_id, key, value = log_data
-            await self.pipe_logger.log(run_id, key, value)
-            self.log_queue.task_done()
+            run_id, key, value = await log_queue.get()
+            await log(run_id, key, value)
+            log_queue.task_done()
 
     async def enqueue_log(self, run_id: uuid.UUID, key: str, value: str):
         if self.log_queue.qsize() < self.config.max_log_queue_size:
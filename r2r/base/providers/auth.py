@@ -1,6 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Optional
+from uuid import UUID
 
 from fastapi import Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -91,6 +92,10 @@ class AuthProvider(Provider, ABC):
     ) -> Dict[str, str]:
         pass
 
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Drop any cached state for a user whose record has changed."""
+        pass
+
     async def auth_wrapper(
         self, auth: Optional[HTTPAuthorizationCredentials] = Security(security)
     ) -> User:
@@ -9,7 +9,11 @@ class CryptoConfig(ProviderConfig):
 
     @property
     def supported_providers(self) -> list[str]:
-        return [None, "bcrypt"]  # Add other crypto providers as needed
+        return [
+            None,
+            "bcrypt",
+            "argon2",
+        ]  # Add other crypto providers as needed
 
     def validate(self) -> None:
         super().validate()
@@ -35,6 +39,10 @@ class CryptoProvider(Provider, ABC):
     ) -> bool:
         pass
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a stored hash should be upgraded to current settings."""
+        return False
+
     @abstractmethod
     def generate_verification_code(self, length: int = 32) -> str:
         pass
@@ -120,8 +120,8 @@ class RelationalDatabaseProvider(Provider, ABC):
     @abstractmethod
     def get_documents_overview(
         self,
-        filter_document_ids: Optional[list[str]] = None,
-        filter_user_ids: Optional[list[str]] = None,
+        filter_document_ids: Optional[list[uuid.UUID]] = None,
+        filter_user_ids: Optional[list[uuid.UUID]] = None,
     ) -> list[DocumentInfo]:
         pass
 
@@ -131,8 +131,16 @@ class RelationalDatabaseProvider(Provider, ABC):
     ) -> dict:
         pass
 
+    def delete_many_from_documents_overview(
+        self, document_ids: list[str]
+    ) -> None:
+        for document_id in document_ids:
+            self.delete_from_documents_overview(document_id)
+
     @abstractmethod
-    def get_users_overview(self, user_ids: Optional[list[str]] = None) -> dict:
+    def get_users_overview(
+        self, user_ids: Optional[list[uuid.UUID]] = None
+    ) -> dict:
         pass
 
     @abstractmethod
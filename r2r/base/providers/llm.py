@@ -122,6 +122,19 @@ class CompletionProvider(Provider):
                 time.sleep(backoff)
                 backoff = min(backoff * 2, self.config.max_backoff)
 
+    @staticmethod
+    def _to_completion(response: Any) -> LLMChatCompletion:
+        # OpenAI clients already return the target type; skip the re-validation
+        if isinstance(response, LLMChatCompletion):
+            return response
+        return LLMChatCompletion(**response.dict())
+
+    @staticmethod
+    def _to_completion_chunk(chunk: Any) -> LLMChatCompletionChunk:
+        if isinstance(chunk, LLMChatCompletionChunk):
+            return chunk
+        return LLMChatCompletionChunk(**chunk.dict())
+
     @abstractmethod
     async def _execute_task(self, task: dict[str, Any]):
         pass
@@ -142,7 +155,7 @@ class CompletionProvider(Provider):
             "kwargs": kwargs,
         }
         response = await self._execute_with_backoff_async(task)
-        return LLMChatCompletion(**response.dict())
+        return self._to_completion(response)
 
     def get_completion(
         self,
@@ -156,7 +169,7 @@ class CompletionProvider(Provider):
             "kwargs": kwargs,
         }
         response = self._execute_with_backoff_sync(task)
-        return LLMChatCompletion(**response.dict())
+        return self._to_completion(response)
 
     async def aget_completion_stream(
         self,
@@ -171,7 +184,7 @@ class CompletionProvider(Provider):
             "kwargs": kwargs,
         }
         async for chunk in self._execute_with_backoff_async_stream(task):
-            yield LLMChatCompletionChunk(**chunk.dict())
+            yield self._to_completion_chunk(chunk)
 
     def get_completion_stream(
         self,
@@ -186,4 +199,4 @@ class CompletionProvider(Provider):
             "kwargs": kwargs,
         }
         for chunk in self._execute_with_backoff_sync_stream(task):
-            yield LLMChatCompletionChunk(**chunk.dict())
+            yield self._to_completion_chunk(chunk)
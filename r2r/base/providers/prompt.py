@@ -51,6 +51,12 @@ class PromptProvider(Provider):
     def get_all_prompts(self) -> dict[str, str]:
         pass
 
+    def get_all_prompts_dict(self) -> dict[str, dict]:
+        return {
+            name: prompt.dict()
+            for name, prompt in self.get_all_prompts().items()
+        }
+
     @abstractmethod
     def update_prompt(
         self,
@@ -1,6 +1,8 @@
 from .base_utils import (
     EntityType,
     Relation,
+    bounded_gather,
+    buffered_async_generator,
     format_entity_types,
     format_relations,
     generate_id_from_label,
@@ -16,6 +18,8 @@ __all__ = [
     "TextSplitter",
     "run_pipeline",
     "to_async_generator",
+    "buffered_async_generator",
+    "bounded_gather",
     "generate_run_id",
     "generate_id_from_label",
     "increment_version",
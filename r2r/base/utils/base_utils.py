@@ -1,6 +1,14 @@
 import asyncio
 import uuid
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Iterable,
+)
 
 if TYPE_CHECKING:
     from ..pipeline.base_pipeline import AsyncPipeline
@@ -21,6 +29,54 @@ async def to_async_generator(
         yield item
 
 
+async def buffered_async_generator(
+    agen: AsyncGenerator[Any, None], size: int = 32
+) -> AsyncGenerator[Any, None]:
+    """Consume `agen` in a background task, buffering up to `size` items."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+    done = object()
+
+    async def feed():
+        try:
+            async for item in agen:
+                await queue.put((item, None))
+        except Exception as e:
+            await queue.put((done, e))
+        else:
+            await queue.put((done, None))
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        feeder.cancel()
+        await asyncio.gather(feeder, return_exceptions=True)
+
+
+async def bounded_gather(
+    aws: AsyncIterable[Awaitable[Any]], limit: int
+) -> AsyncGenerator[Any, None]:
+    """Await `aws` at most `limit` at a time, yielding results in order."""
+    in_flight: deque[asyncio.Future] = deque()
+    try:
+        async for aw in aws:
+            in_flight.append(asyncio.ensure_future(aw))
+            if len(in_flight) >= limit:
+                yield await in_flight.popleft()
+        while in_flight:
+            yield await in_flight.popleft()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
 def run_pipeline(pipeline: "AsyncPipeline", input: Any, *args, **kwargs):
     if not isinstance(input, AsyncGenerator):
         if not isinstance(input, list):
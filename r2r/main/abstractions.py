@@ -36,6 +36,7 @@ class R2RProviders(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+        frozen = True
 
 
 class R2RPipes(BaseModel):
@@ -53,6 +54,7 @@ class R2RPipes(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+        frozen = True
 
 
 class R2RPipelines(BaseModel):
@@ -64,6 +66,7 @@ class R2RPipelines(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+        frozen = True
 
 
 class R2RAgents(BaseModel):
@@ -72,3 +75,4 @@ class R2RAgents(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+        frozen = True
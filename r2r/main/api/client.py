@@ -1,5 +1,6 @@
 import asyncio
 import json
+import logging
 import os
 import uuid
 from contextlib import ExitStack
@@ -45,6 +46,8 @@ from .routes.retrieval.requests import (
 
 nest_asyncio.apply()
 
+logger = logging.getLogger(__name__)
+
 
 def handle_request_error(response):
     if response.status_code < 400:
@@ -326,7 +329,7 @@ class R2RClient:
             task_prompt_override=task_prompt_override,
             include_title_if_available=include_title_if_available,
         )
-        print("request = ", request)
+        logger.debug("request = %s", request)
 
         if rag_generation_config and rag_generation_config.get(
             "stream", False
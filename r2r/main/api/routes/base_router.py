@@ -1,7 +1,7 @@
 import functools
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
 from r2r.base import R2RException, manage_run
@@ -13,6 +13,11 @@ class BaseRouter:
     def __init__(self, engine):
         self.engine = engine
         self.router = APIRouter()
+        # Resolved once so every protected route shares one dependency
+        auth_provider = engine.providers.auth
+        self.auth_dependency = (
+            Depends(auth_provider.auth_wrapper) if auth_provider else None
+        )
 
     def base_endpoint(self, func):
         @functools.wraps(func)
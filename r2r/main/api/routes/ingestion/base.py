@@ -25,11 +25,7 @@ class IngestionRouter(BaseRouter):
             request: R2RIngestFilesRequest = Depends(
                 IngestionService.parse_ingest_files_form_data
             ),
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             chunking_config_override = None
             if request.chunking_config_override:
@@ -54,11 +50,7 @@ class IngestionRouter(BaseRouter):
             request: R2RUpdateFilesRequest = Depends(
                 IngestionService.parse_update_files_form_data
             ),
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             chunking_config_override = None
             if request.chunking_config_override:
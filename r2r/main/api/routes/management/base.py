@@ -1,8 +1,11 @@
 # TODO - Cleanup the handling for non-auth configurations
+import json
 from datetime import datetime, timezone
 
 import psutil
-from fastapi import Depends
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from r2r.base import R2RException
@@ -36,11 +39,7 @@ class ManagementRouter(BaseRouter):
         @self.router.get("/server_stats")
         @self.base_endpoint
         async def server_stats(
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -60,11 +59,7 @@ class ManagementRouter(BaseRouter):
         @self.base_endpoint
         async def update_prompt_app(
             request: R2RUpdatePromptRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -81,32 +76,39 @@ class ManagementRouter(BaseRouter):
         @self.base_endpoint
         async def logs_app(
             request: R2RLogsRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            http_request: Request,
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser:
                 raise R2RException(
                     "Only a superuser can call the `logs` endpoint.", 403
                 )
 
-            return await self.engine.alogs(
+            stream = "application/x-ndjson" in http_request.headers.get(
+                "accept", ""
+            )
+            logs = await self.engine.alogs(
                 log_type_filter=request.log_type_filter,
                 max_runs_requested=request.max_runs_requested,
+                stream=stream,
             )
+            if stream:
+                # One JSON document per run, sent as each run is aggregated
+                return StreamingResponse(
+                    (
+                        json.dumps(jsonable_encoder(log_entry)) + "\n"
+                        for log_entry in logs
+                    ),
+                    media_type="application/x-ndjson",
+                )
+            return logs
 
         @self.router.post("/analytics")
         @self.router.get("/analytics")
         @self.base_endpoint
         async def get_analytics_app(
             request: R2RAnalyticsRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -122,11 +124,7 @@ class ManagementRouter(BaseRouter):
         @self.base_endpoint
         async def delete_app(
             request: R2RDeleteRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser and (
                 "user_id" in request.keys
@@ -150,11 +148,7 @@ class ManagementRouter(BaseRouter):
         @self.base_endpoint
         async def document_chunks_app(
             request: R2RDocumentChunksRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             chunks = await self.engine.adocument_chunks(request.document_id)
 
@@ -179,11 +173,7 @@ class ManagementRouter(BaseRouter):
         @self.base_endpoint
         async def users_overview_app(
             request: R2RUsersOverviewRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -198,11 +188,7 @@ class ManagementRouter(BaseRouter):
         @self.base_endpoint
         async def documents_overview_app(
             request: R2RDocumentsOverviewRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             request_user_ids = request.user_ids
 
@@ -221,11 +207,7 @@ class ManagementRouter(BaseRouter):
         @self.base_endpoint
         async def inspect_knowledge_graph(
             request: R2RPrintRelationshipsRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -239,11 +221,7 @@ class ManagementRouter(BaseRouter):
         @self.router.get("/app_settings")
         @self.base_endpoint
         async def app_settings(
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -1,4 +1,3 @@
-from fastapi import Depends
 from fastapi.responses import StreamingResponse
 
 from r2r.base import GenerationConfig, KGSearchSettings, VectorSearchSettings
@@ -16,6 +15,10 @@ from ..base_router import BaseRouter
 class RetrievalRouter(BaseRouter):
     def __init__(self, engine: R2REngine):
         super().__init__(engine)
+        # Shared by requests that don't override them; the retrieval service
+        # never mutates the settings it is given
+        self.default_vector_search_settings = VectorSearchSettings()
+        self.default_kg_search_settings = KGSearchSettings()
         self.setup_routes()
 
     def setup_routes(self):
@@ -23,11 +26,7 @@ class RetrievalRouter(BaseRouter):
         @self.base_endpoint
         async def search_app(
             request: R2RSearchRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             kg_search_settings = request.kg_search_settings or {}
 
@@ -48,8 +47,10 @@ class RetrievalRouter(BaseRouter):
 
             results = await self.engine.asearch(
                 query=request.query,
-                vector_search_settings=VectorSearchSettings(
-                    **(request.vector_search_settings or {})
+                vector_search_settings=(
+                    VectorSearchSettings(**request.vector_search_settings)
+                    if request.vector_search_settings
+                    else self.default_vector_search_settings
                 ),
                 kg_search_settings=KGSearchSettings(**kg_search_settings),
                 user=auth_user,
@@ -60,11 +61,7 @@ class RetrievalRouter(BaseRouter):
         @self.base_endpoint
         async def rag_app(
             request: R2RRAGRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if (
                 request.kg_search_settings
@@ -83,11 +80,15 @@ class RetrievalRouter(BaseRouter):
                 )
             response = await self.engine.arag(
                 query=request.query,
-                vector_search_settings=VectorSearchSettings(
-                    **(request.vector_search_settings or {})
+                vector_search_settings=(
+                    VectorSearchSettings(**request.vector_search_settings)
+                    if request.vector_search_settings
+                    else self.default_vector_search_settings
                 ),
-                kg_search_settings=KGSearchSettings(
-                    **(request.kg_search_settings or {})
+                kg_search_settings=(
+                    KGSearchSettings(**request.kg_search_settings)
+                    if request.kg_search_settings
+                    else self.default_kg_search_settings
                 ),
                 rag_generation_config=GenerationConfig(
                     **(request.rag_generation_config or {})
@@ -99,13 +100,8 @@ class RetrievalRouter(BaseRouter):
                 request.rag_generation_config
                 and request.rag_generation_config.get("stream", False)
             ):
-
-                async def stream_generator():
-                    async for chunk in response:
-                        yield chunk
-
                 return StreamingResponse(
-                    stream_generator(), media_type="application/json"
+                    response, media_type="application/json"
                 )
             else:
                 return response
@@ -114,11 +110,7 @@ class RetrievalRouter(BaseRouter):
         @self.base_endpoint
         async def agent_app(
             request: R2RAgentRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             if (
                 request.kg_search_settings
@@ -137,11 +129,15 @@ class RetrievalRouter(BaseRouter):
 
             response = await self.engine.arag_agent(
                 messages=request.messages,
-                vector_search_settings=VectorSearchSettings(
-                    **(request.vector_search_settings or {})
+                vector_search_settings=(
+                    VectorSearchSettings(**request.vector_search_settings)
+                    if request.vector_search_settings
+                    else self.default_vector_search_settings
                 ),
-                kg_search_settings=KGSearchSettings(
-                    **(request.kg_search_settings or {})
+                kg_search_settings=(
+                    KGSearchSettings(**request.kg_search_settings)
+                    if request.kg_search_settings
+                    else self.default_kg_search_settings
                 ),
                 rag_generation_config=GenerationConfig(
                     **(request.rag_generation_config or {})
@@ -155,13 +151,8 @@ class RetrievalRouter(BaseRouter):
                 request.rag_generation_config
                 and request.rag_generation_config.get("stream", False)
             ):
-
-                async def stream_generator():
-                    async for chunk in response:
-                        yield chunk
-
                 return StreamingResponse(
-                    stream_generator(), media_type="application/json"
+                    response, media_type="application/json"
                 )
             else:
                 return response
@@ -170,11 +161,7 @@ class RetrievalRouter(BaseRouter):
         @self.base_endpoint
         async def evaluate_app(
             request: R2REvalRequest,
-            auth_user=(
-                Depends(self.engine.providers.auth.auth_wrapper)
-                if self.engine.providers.auth
-                else None
-            ),
+            auth_user=self.auth_dependency,
         ):
             results = await self.engine.aevaluate(
                 query=request.query,
@@ -1,11 +1,19 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import FastAPI
 
+from r2r.base import KVLoggingSingleton
+
 from .engine import R2REngine
 
 
 class R2RApp:
     def __init__(self, engine: R2REngine):
         self.engine = engine
+        # Routes are fixed after setup, so the spec is only built once
+        self._openapi_spec = None
         self._setup_routes()
         self._apply_cors()
 
@@ -20,7 +28,10 @@ class R2RApp:
         from .api.routes.management import base as management_base
         from .api.routes.retrieval import base as retrieval_base
 
-        self.app = FastAPI()
+        self.app = FastAPI(default_response_class=self._response_class())
+        # The logging connection is shared for the app's lifetime
+        self.app.add_event_handler("shutdown", KVLoggingSingleton.close)
+        self.app.add_event_handler("startup", self._configure_thread_pool)
 
         # Create routers with the engine
         ingestion_router = ingestion_base.IngestionRouter.build_router(
@@ -44,11 +55,39 @@ class R2RApp:
         async def openapi_spec():
             from fastapi.openapi.utils import get_openapi
 
-            return get_openapi(
-                title="R2R Application API",
-                version="1.0.0",
-                routes=self.app.routes,
-            )
+            if self._openapi_spec is None:
+                self._openapi_spec = await asyncio.to_thread(
+                    get_openapi,
+                    title="R2R Application API",
+                    version="1.0.0",
+                    routes=self.app.routes,
+                )
+            return self._openapi_spec
+
+    @staticmethod
+    def _response_class():
+        # orjson comes with the fast-json extra; without it use the stdlib
+        try:
+            import orjson  # noqa: F401
+            from fastapi.responses import ORJSONResponse
+
+            return ORJSONResponse
+        except ImportError:
+            from fastapi.responses import JSONResponse
+
+            return JSONResponse
+
+    @staticmethod
+    async def _configure_thread_pool():
+        # Upload reads, sync route handlers and provider calls offloaded with
+        # asyncio.to_thread all share these pools; R2R_THREAD_POOL_SIZE sizes them
+        import anyio.to_thread
+
+        size = int(os.getenv("R2R_THREAD_POOL_SIZE", "64"))
+        anyio.to_thread.current_default_thread_limiter().total_tokens = size
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=size)
+        )
 
     def _apply_cors(self):
         from fastapi.middleware.cors import CORSMiddleware
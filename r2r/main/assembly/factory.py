@@ -75,7 +75,17 @@ class R2RProviderFactory:
             from r2r.providers.crypto import BCryptConfig, BCryptProvider
 
             crypto_provider = BCryptProvider(
-                BCryptConfig(**crypto_config.dict())
+                BCryptConfig(
+                    **crypto_config.dict(), **crypto_config.extra_fields
+                )
+            )
+        elif crypto_config.provider == "argon2":
+            from r2r.providers.crypto import Argon2Config, Argon2Provider
+
+            crypto_provider = Argon2Provider(
+                Argon2Config(
+                    **crypto_config.dict(), **crypto_config.extra_fields
+                )
             )
         elif crypto_config.provider is None:
             crypto_provider = None
@@ -1,6 +1,14 @@
 from typing import Optional
 
-from r2r.base import KVLoggingSingleton, RunManager
+from r2r.base import (
+    GenerationConfig,
+    KGSearchSettings,
+    KVLoggingSingleton,
+    RunManager,
+    User,
+    UserCreate,
+    VectorSearchSettings,
+)
 from r2r.base.abstractions.base import AsyncSyncMeta, syncable
 
 from .abstractions import R2RAgents, R2RPipelines, R2RProviders
@@ -27,7 +35,7 @@ class R2REngine(metaclass=AsyncSyncMeta):
         self.providers = providers
         self.pipelines = pipelines
         self.agents = agents
-        self.logging_connection = KVLoggingSingleton()
+        self.logging_connection = logging_connection
         self.run_manager = run_manager
 
         self.ingestion_service = IngestionService(
@@ -81,12 +89,36 @@ class R2REngine(metaclass=AsyncSyncMeta):
         return await self.ingestion_service.update_files(*args, **kwargs)
 
     @syncable
-    async def asearch(self, *args, **kwargs):
-        return await self.retrieval_service.search(*args, **kwargs)
+    async def asearch(
+        self,
+        query: str,
+        vector_search_settings: VectorSearchSettings = VectorSearchSettings(),
+        kg_search_settings: KGSearchSettings = KGSearchSettings(),
+        user: Optional[User] = None,
+        **kwargs,
+    ):
+        return await self.retrieval_service.search(
+            query, vector_search_settings, kg_search_settings, user, **kwargs
+        )
 
     @syncable
-    async def arag(self, *args, **kwargs):
-        return await self.retrieval_service.rag(*args, **kwargs)
+    async def arag(
+        self,
+        query: str,
+        rag_generation_config: GenerationConfig,
+        vector_search_settings: VectorSearchSettings = VectorSearchSettings(),
+        kg_search_settings: KGSearchSettings = KGSearchSettings(),
+        user: Optional[User] = None,
+        **kwargs,
+    ):
+        return await self.retrieval_service.rag(
+            query,
+            rag_generation_config,
+            vector_search_settings,
+            kg_search_settings,
+            user,
+            **kwargs,
+        )
 
     @syncable
     async def arag_agent(self, *args, **kwargs):
@@ -141,16 +173,16 @@ class R2REngine(metaclass=AsyncSyncMeta):
         return await self.management_service.document_chunks(*args, **kwargs)
 
     @syncable
-    async def aregister(self, *args, **kwargs):
-        return await self.auth_service.register(*args, **kwargs)
+    async def aregister(self, user: UserCreate):
+        return await self.auth_service.register(user)
 
     @syncable
     async def averify_email(self, *args, **kwargs):
         return await self.auth_service.verify_email(*args, **kwargs)
 
     @syncable
-    async def alogin(self, *args, **kwargs):
-        return await self.auth_service.login(*args, **kwargs)
+    async def alogin(self, email: str, password: str):
+        return await self.auth_service.login(email, password)
 
     @syncable
     async def auser(self, *args, **kwargs):
@@ -161,8 +193,10 @@ class R2REngine(metaclass=AsyncSyncMeta):
         return await self.auth_service.update_user(*args, **kwargs)
 
     @syncable
-    async def arefresh_access_token(self, *args, **kwargs):
-        return await self.auth_service.refresh_access_token(*args, **kwargs)
+    async def arefresh_access_token(self, user_email: str, refresh_token: str):
+        return await self.auth_service.refresh_access_token(
+            user_email, refresh_token
+        )
 
     @syncable
     async def achange_password(self, *args, **kwargs):
@@ -1,5 +1,4 @@
 import ast
-import asyncio
 import json
 import os
 import threading
@@ -317,29 +316,8 @@ class R2RExecutionWrapper:
                     **(rag_generation_config or {})
                 ),
             )
-            if not stream:
-                return response
-            else:
-
-                async def async_generator():
-                    async for chunk in response:
-                        yield chunk
-
-                def sync_generator():
-                    try:
-                        loop = asyncio.get_event_loop()
-                        async_gen = async_generator()
-                        while True:
-                            try:
-                                yield loop.run_until_complete(
-                                    async_gen.__anext__()
-                                )
-                            except StopAsyncIteration:
-                                break
-                    except Exception:
-                        pass
-
-                return sync_generator()
+            # Streaming responses are already synchronous generators
+            return response
 
     def documents_overview(
         self,
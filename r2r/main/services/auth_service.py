@@ -1,4 +1,8 @@
+import asyncio
+import hashlib
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -35,10 +39,25 @@ class AuthService(Service):
             run_manager,
             logging_connection,
         )
+        self._refresh_inflight: dict[tuple[str, str], asyncio.Future] = {}
+        # Password hashing is deliberately slow CPU work; it runs here, off the
+        # event loop, and the pool size caps how many hashes run at once
+        self._password_hash_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="password-hash",
+        )
+
+    async def _run_password_hashing(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._password_hash_pool, func, *args
+        )
 
     @telemetry_event("RegisterUser")
     async def register(self, user: UserCreate) -> User:
-        return self.providers.auth.register(user)
+        return await self._run_password_hashing(
+            self.providers.auth.register, user
+        )
 
     @telemetry_event("VerifyEmail")
     async def verify_email(self, verification_code: str) -> bool:
@@ -64,27 +83,35 @@ class AuthService(Service):
 
     @telemetry_event("Login")
     async def login(self, email: str, password: str) -> dict[str, Token]:
-        return self.providers.auth.login(email, password)
+        return await self._run_password_hashing(
+            self.providers.auth.login, email, password
+        )
 
     @telemetry_event("GetCurrentUser")
     async def user(self, token: str) -> User:
-        token_data = self.providers.auth.decode_token(token)
-        user = self.providers.database.relational.get_user_by_email(
-            token_data.email
-        )
-        if user is None:
-            raise R2RException(
-                status_code=401, message="Invalid authentication credentials"
-            )
-        return user
+        return self.providers.auth.user(token)
 
     @telemetry_event("RefreshToken")
     async def refresh_access_token(
         self, user_email: str, refresh_token: str
     ) -> dict[str, Token]:
-        return self.providers.auth.refresh_access_token(
-            user_email, refresh_token
-        )
+        # Refreshing blacklists the old token, so concurrent refreshes of the
+        # same token share one in-flight call instead of racing to a 401
+        key = (user_email, hashlib.sha256(refresh_token.encode()).hexdigest())
+        inflight = self._refresh_inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self.providers.auth.refresh_access_token,
+                    user_email,
+                    refresh_token,
+                )
+            )
+            self._refresh_inflight[key] = inflight
+            inflight.add_done_callback(
+                lambda _: self._refresh_inflight.pop(key, None)
+            )
+        return await asyncio.shield(inflight)
 
     @telemetry_event("ChangePassword")
     async def change_password(
@@ -92,8 +119,11 @@ class AuthService(Service):
     ) -> dict[str, str]:
         if not user:
             raise R2RException(status_code=404, message="User not found")
-        return self.providers.auth.change_password(
-            user, current_password, new_password
+        return await self._run_password_hashing(
+            self.providers.auth.change_password,
+            user,
+            current_password,
+            new_password,
         )
 
     @telemetry_event("RequestPasswordReset")
@@ -104,8 +134,10 @@ class AuthService(Service):
     async def confirm_password_reset(
         self, reset_token: str, new_password: str
     ) -> dict[str, str]:
-        return self.providers.auth.confirm_password_reset(
-            reset_token, new_password
+        return await self._run_password_hashing(
+            self.providers.auth.confirm_password_reset,
+            reset_token,
+            new_password,
         )
 
     @telemetry_event("Logout")
@@ -128,7 +160,9 @@ class AuthService(Service):
             raise R2RException(status_code=404, message="User not found")
         for key, value in user_data.items():
             setattr(user, key, value)
-        return self.providers.database.relational.update_user(user)
+        user = self.providers.database.relational.update_user(user)
+        self.providers.auth.invalidate_user(user_id)
+        return user
 
     @telemetry_event("DeleteUserAccount")
     async def delete_user(
@@ -137,11 +171,14 @@ class AuthService(Service):
         user = self.providers.database.relational.get_user_by_id(user_id)
         if not user:
             raise R2RException(status_code=404, message="User not found")
-        if not self.providers.auth.crypto_provider.verify_password(
-            password, user.hashed_password
+        if not await self._run_password_hashing(
+            self.providers.auth.crypto_provider.verify_password,
+            password,
+            user.hashed_password,
         ):
             raise R2RException(status_code=400, message="Incorrect password")
         self.providers.database.relational.delete_user(user_id)
+        self.providers.auth.invalidate_user(user_id)
         return {"message": "User account deleted successfully"}
 
     @telemetry_event("CleanExpiredBlacklistedTokens")
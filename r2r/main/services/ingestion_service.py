@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import uuid
@@ -55,22 +56,29 @@ class IngestionService(Service):
         )
 
     def _file_to_document(
-        self, file: UploadFile, document_id: uuid.UUID, metadata: dict
+        self,
+        file: UploadFile,
+        document_id: uuid.UUID,
+        metadata: dict,
+        data: bytes,
     ) -> Document:
-        file_extension = file.filename.split(".")[-1].lower()
-        if file_extension.upper() not in DocumentType.__members__:
+        file_extension = file.filename.rpartition(".")[2].lower()
+        document_type = DocumentType.__members__.get(file_extension.upper())
+        if document_type is None:
             raise R2RException(
                 status_code=415,
                 message=f"'{file_extension}' is not a valid DocumentType.",
             )
 
-        document_title = metadata.get("title") or file.filename.split("/")[-1]
+        document_title = (
+            metadata.get("title") or file.filename.rpartition("/")[2]
+        )
         metadata["title"] = document_title
 
         return Document(
             id=document_id,
-            type=DocumentType[file_extension.upper()],
-            data=file.file.read(),
+            type=document_type,
+            data=data,
             metadata=metadata,
         )
 
@@ -108,6 +116,8 @@ class IngestionService(Service):
             doc_info.document_id: doc_info for doc_info in existing_documents
         }
 
+        # Every document in the batch shares one creation timestamp
+        now = datetime.now()
         for iteration, document in enumerate(documents):
             version = versions[iteration] if versions else "v0"
 
@@ -150,7 +160,6 @@ class IngestionService(Service):
                 )
                 continue
 
-            now = datetime.now()
             document_info_metadata = document.metadata.copy()
             title = document_info_metadata.pop("title", str(document.id))
             user_id = document_info_metadata.pop("user_id", None)
@@ -233,16 +242,19 @@ class IngestionService(Service):
             )
 
         try:
-            documents = []
-            for iteration, file in enumerate(files):
+            for file in files:
                 if not file.filename:
                     raise R2RException(
                         status_code=400, message="File name not provided."
                     )
 
+            contents = await asyncio.gather(*(file.read() for file in files))
+
+            documents = []
+            for iteration, (file, data) in enumerate(zip(files, contents)):
                 document_metadata = metadatas[iteration] if metadatas else {}
 
-                id_label = str(file.filename.split("/")[-1])
+                id_label = file.filename.rpartition("/")[2]
                 # Make user-level ids unique
                 if user:
                     id_label += str(user.id)
@@ -253,7 +265,7 @@ class IngestionService(Service):
                 )
 
                 document = self._file_to_document(
-                    file, document_id, document_metadata
+                    file, document_id, document_metadata, data
                 )
                 documents.append(document)
             return await self.ingest_documents(
@@ -261,8 +273,9 @@ class IngestionService(Service):
             )
 
         finally:
-            for file in files:
-                file.file.close()
+            await asyncio.gather(
+                *(file.close() for file in files), return_exceptions=True
+            )
 
     @telemetry_event("UpdateFiles")
     async def update_files(
@@ -293,9 +306,7 @@ class IngestionService(Service):
 
             documents_overview = (
                 self.providers.database.relational.get_documents_overview(
-                    filter_document_ids=[
-                        str(doc_id) for doc_id in document_ids
-                    ]
+                    filter_document_ids=document_ids
                 )
             )
 
@@ -305,11 +316,13 @@ class IngestionService(Service):
                     message="One or more documents was not found.",
                 )
 
+            contents = await asyncio.gather(*(file.read() for file in files))
+
             documents = []
             new_versions = []
 
-            for it, (file, doc_id, doc_info) in enumerate(
-                zip(files, document_ids, documents_overview)
+            for it, (file, doc_id, doc_info, data) in enumerate(
+                zip(files, document_ids, documents_overview, contents)
             ):
                 if not doc_info:
                     raise R2RException(
@@ -329,16 +342,13 @@ class IngestionService(Service):
                 new_version = increment_version(doc_info.version)
                 new_versions.append(new_version)
 
+                # _file_to_document fills in the title from the filename
                 updated_metadata = (
                     metadatas[it] if metadatas else doc_info.metadata
                 )
-                updated_metadata["title"] = (
-                    updated_metadata.get("title", None)
-                    or file.filename.split("/")[-1]
-                )
 
                 document = self._file_to_document(
-                    file, doc_id, updated_metadata
+                    file, doc_id, updated_metadata, data
                 )
                 documents.append(document)
 
@@ -346,26 +356,41 @@ class IngestionService(Service):
                 documents, versions=new_versions, user=user, *args, **kwargs
             )
 
-            for doc_id, old_version in zip(
-                document_ids,
-                [doc_info.version for doc_info in documents_overview],
-            ):
+            async def delete_old_version(doc_id, old_version):
                 keys = ["document_id", "version"]
                 values = [str(doc_id), old_version]
                 if user:
                     keys.append("user_id")
                     values.append(str(user.id))
 
-                self.providers.database.vector.delete_by_metadata(keys, values)
-                self.providers.database.relational.delete_from_documents_overview(
-                    doc_id, old_version
+                await asyncio.to_thread(
+                    self.providers.database.vector.delete_by_metadata,
+                    keys,
+                    values,
+                )
+                await asyncio.to_thread(
+                    self.providers.database.relational.delete_from_documents_overview,
+                    doc_id,
+                    old_version,
                 )
 
+            # Each document's old version is removed in its own session, so
+            # the deletes can run side by side
+            await asyncio.gather(
+                *(
+                    delete_old_version(doc_id, doc_info.version)
+                    for doc_id, doc_info in zip(
+                        document_ids, documents_overview
+                    )
+                )
+            )
+
             return ingestion_results
 
         finally:
-            for file in files:
-                file.file.close()
+            await asyncio.gather(
+                *(file.close() for file in files), return_exceptions=True
+            )
 
     async def _process_ingestion_results(
         self,
@@ -468,10 +493,8 @@ class IngestionService(Service):
                 if document_ids and document_ids != "null"
                 else None
             )
-            if parsed_document_ids is not None:
-                parsed_document_ids = [
-                    uuid.UUID(doc_id) for doc_id in parsed_document_ids
-                ]
+            # The ids are left as strings; R2RIngestFilesRequest validates the
+            # whole list as UUIDs in one pass
 
             parsed_versions = (
                 json.loads(versions)
@@ -525,9 +548,6 @@ class IngestionService(Service):
             parsed_document_ids = json.loads(document_ids)
             if not isinstance(parsed_document_ids, list):
                 raise ValueError("document_ids must be a list")
-            parsed_document_ids = [
-                uuid.UUID(doc_id) for doc_id in parsed_document_ids
-            ]
             chunking_config_override = (
                 json.loads(chunking_config_override)
                 if chunking_config_override
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import uuid
@@ -8,7 +9,6 @@ from r2r.base import (
     AnalysisTypes,
     FilterCriteria,
     KVLoggingSingleton,
-    LogProcessor,
     R2RException,
     RunManager,
 )
@@ -39,6 +39,8 @@ class ManagementService(Service):
             run_manager,
             logging_connection,
         )
+        # The config is fixed once the engine is built; serialize it once
+        self._config_toml: Optional[str] = None
 
     @telemetry_event("UpdatePrompt")
     async def update_prompt(
@@ -57,6 +59,7 @@ class ManagementService(Service):
         self,
         log_type_filter: Optional[str] = None,
         max_runs_requested: int = 100,
+        stream: bool = False,
         *args: Any,
         **kwargs: Any,
     ):
@@ -65,32 +68,35 @@ class ManagementService(Service):
                 status_code=404, message="Logging provider not found."
             )
 
-        run_info = await self.logging_connection.get_run_info(
+        run_info, logs = await self.logging_connection.get_run_info_and_logs(
             limit=max_runs_requested,
             log_type_filter=log_type_filter,
         )
-        run_ids = [run.run_id for run in run_info]
-        if len(run_ids) == 0:
+        if not run_info:
             return []
-        logs = await self.logging_connection.get_logs(run_ids)
 
-        aggregated_logs = []
-        warning_shown = False
+        aggregated_logs = self._aggregate_logs(run_info, logs)
+        # When streaming, runs are aggregated one at a time as they are sent
+        return aggregated_logs if stream else list(aggregated_logs)
 
-        for run in run_info:
-            run_logs = [
-                log for log in logs if log["log_id"] == str(run.run_id)
-            ]
-            entries = [
+    @staticmethod
+    def _aggregate_logs(run_info, logs):
+        # Bucket the logs by run in one pass instead of rescanning per run
+        logs_by_run = defaultdict(list)
+        for log in logs:
+            logs_by_run[log["log_id"]].append(
                 {
                     "key": log["key"],
                     "value": log["value"],
                     "timestamp": log["timestamp"],
                 }
-                for log in run_logs
-            ][
-                ::-1
-            ]  # Reverse order so that earliest logged values appear first.
+            )
+
+        warning_shown = False
+
+        for run in run_info:
+            # Reverse order so that earliest logged values appear first.
+            entries = logs_by_run.get(str(run.run_id), [])[::-1]
 
             log_entry = {
                 "run_id": run.run_id,
@@ -110,9 +116,7 @@ class ManagementService(Service):
                 )
                 warning_shown = True
 
-            aggregated_logs.append(log_entry)
-
-        return aggregated_logs
+            yield log_entry
 
     @telemetry_event("Analytics")
     async def aanalytics(
@@ -122,40 +126,39 @@ class ManagementService(Service):
         *args,
         **kwargs,
     ):
-        run_info = await self.logging_connection.get_run_info(limit=100)
-        run_ids = [info.run_id for info in run_info]
+        run_info, logs = await self.logging_connection.get_run_info_and_logs(
+            limit=100
+        )
 
-        if not run_ids:
+        if not run_info:
             return {
                 "analytics_data": "No logs found.",
                 "filtered_logs": {},
             }
-        logs = await self.logging_connection.get_logs(run_ids=run_ids)
 
-        filters = {}
+        # Index the filters by the key they match, so each log is routed to
+        # its populations with one lookup instead of testing every filter
+        filter_names_by_key = defaultdict(list)
+        filtered_logs = {}
         if filter_criteria.filters:
-            for key, value in filter_criteria.filters.items():
-                filters[key] = lambda log, value=value: (
-                    any(
-                        entry.get("key") == value
-                        for entry in log.get("entries", [])
-                    )
-                    if "entries" in log
-                    else log.get("key") == value
-                )
+            for name, value in filter_criteria.filters.items():
+                filter_names_by_key[value].append(name)
+                filtered_logs[name] = []
 
-        log_processor = LogProcessor(filters)
         for log in logs:
             if "entries" in log and isinstance(log["entries"], list):
-                log_processor.process_log(log)
+                log_keys = {entry.get("key") for entry in log["entries"]}
             elif "key" in log:
-                log_processor.process_log(log)
+                log_keys = (log["key"],)
             else:
                 logger.warning(
                     f"Skipping log due to missing or malformed 'entries': {log}"
                 )
+                continue
+            for log_key in log_keys:
+                for name in filter_names_by_key.get(log_key, ()):
+                    filtered_logs[name].append(log)
 
-        filtered_logs = dict(log_processor.populations.items())
         results = {"filtered_logs": filtered_logs}
 
         if analysis_types and analysis_types.analysis_types:
@@ -198,12 +201,11 @@ class ManagementService(Service):
 
     @telemetry_event("AppSettings")
     async def aapp_settings(self, *args: Any, **kwargs: Any):
-        prompts = self.providers.prompt.get_all_prompts()
+        if self._config_toml is None:
+            self._config_toml = await asyncio.to_thread(self.config.to_toml)
         return {
-            "config": self.config.to_toml(),
-            "prompts": {
-                name: prompt.dict() for name, prompt in prompts.items()
-            },
+            "config": self._config_toml,
+            "prompts": self.providers.prompt.get_all_prompts_dict(),
         }
 
     @telemetry_event("ScoreCompletion")
@@ -222,13 +224,10 @@ class ManagementService(Service):
                     status_code=404, message="Logging provider not found."
                 )
 
-            run_info = await self.logging_connection.get_run_info(
+            _, logs = await self.logging_connection.get_run_info_and_logs(
                 limit=max_runs_requested,
                 log_type_filter=log_type_filter,
             )
-            run_ids = [run.run_id for run in run_info]
-
-            logs = await self.logging_connection.get_logs(run_ids)
 
             for log in logs:
                 if log["key"] != "completion_record":
@@ -262,8 +261,9 @@ class ManagementService(Service):
         *args,
         **kwargs,
     ):
+        # The provider stringifies the ids as it binds them
         return self.providers.database.relational.get_users_overview(
-            [str(ele) for ele in user_ids] if user_ids else None
+            user_ids or None
         )
 
     @telemetry_event("Delete")
@@ -284,10 +284,9 @@ class ManagementService(Service):
             raise R2RException(
                 status_code=404, message="No entries found for deletion."
             )
-        for id in ids:
-            self.providers.database.relational.delete_from_documents_overview(
-                id
-            )
+        self.providers.database.relational.delete_many_from_documents_overview(
+            ids
+        )
         return f"Documents {ids} deleted successfully."
 
     @telemetry_event("DocumentsOverview")
@@ -299,12 +298,8 @@ class ManagementService(Service):
         **kwargs: Any,
     ):
         return self.providers.database.relational.get_documents_overview(
-            filter_document_ids=(
-                [str(ele) for ele in document_ids] if document_ids else None
-            ),
-            filter_user_ids=(
-                [str(ele) for ele in user_ids] if user_ids else None
-            ),
+            filter_document_ids=document_ids or None,
+            filter_user_ids=user_ids or None,
         )
 
     @telemetry_event("DocumentChunks")
@@ -325,9 +320,7 @@ class ManagementService(Service):
         *args,
         **kwargs,
     ):
-        return self.providers.database.relational.get_users_overview(
-            [str(ele) for ele in user_ids]
-        )
+        return self.providers.database.relational.get_users_overview(user_ids)
 
     @telemetry_event("InspectKnowledgeGraph")
     async def inspect_knowledge_graph(
@@ -449,10 +442,7 @@ class ManagementService(Service):
         *args,
         **kwargs,
     ):
-        prompts = self.providers.prompt.get_all_prompts()
         return {
             "config": self.config.to_json(),
-            "prompts": {
-                name: prompt.dict() for name, prompt in prompts.items()
-            },
+            "prompts": self.providers.prompt.get_all_prompts_dict(),
         }
@@ -4,6 +4,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
+import httpx
+
 from r2r.base import (
     CompletionRecord,
     GenerationConfig,
@@ -15,6 +17,7 @@ from r2r.base import (
     RunManager,
     User,
     VectorSearchSettings,
+    buffered_async_generator,
     generate_id_from_label,
     manage_run,
     to_async_generator,
@@ -48,6 +51,37 @@ class RetrievalService(Service):
             logging_connection,
         )
 
+    @staticmethod
+    def _pipeline_error(error: Exception) -> R2RException:
+        # LLM clients wrap transport failures in their own exception types,
+        # so look for the underlying connection error in the cause chain
+        cause = error
+        while cause is not None:
+            if isinstance(cause, (ConnectionError, httpx.TransportError)):
+                return R2RException(
+                    status_code=502,
+                    message="LLM provider not reachable",
+                )
+            cause = cause.__cause__ or cause.__context__
+        return R2RException(status_code=500, message="Internal Server Error")
+
+    @staticmethod
+    def _scope_search_filters(
+        vector_search_settings: VectorSearchSettings, user: Optional[User]
+    ) -> VectorSearchSettings:
+        # Works on a copy: the settings may be a shared default instance, and
+        # a user_id filter must never leak into another caller's search
+        # TODO - Remove these transforms once we have a better way to handle this
+        search_filters = {
+            filter: str(value) if isinstance(value, uuid.UUID) else value
+            for filter, value in vector_search_settings.search_filters.items()
+        }
+        if user and not user.is_superuser:
+            search_filters["user_id"] = str(user.id)
+        return vector_search_settings.model_copy(
+            update={"search_filters": search_filters}
+        )
+
     @telemetry_event("Search")
     async def search(
         self,
@@ -79,12 +113,9 @@ class RetrievalService(Service):
                     message="Vector search is not enabled in the configuration.",
                 )
 
-            # TODO - Remove these transforms once we have a better way to handle this
-            for filter, value in vector_search_settings.search_filters.items():
-                if isinstance(value, uuid.UUID):
-                    vector_search_settings.search_filters[filter] = str(value)
-            if user and not user.is_superuser:
-                vector_search_settings.search_filters["user_id"] = str(user.id)
+            vector_search_settings = self._scope_search_filters(
+                vector_search_settings, user
+            )
 
             results = await self.pipelines.search_pipeline.run(
                 input=to_async_generator([query]),
@@ -121,20 +152,9 @@ class RetrievalService(Service):
     ):
         async with manage_run(self.run_manager, "rag_app") as run_id:
             try:
-                # TODO - Remove these transforms once we have a better way to handle this
-                for (
-                    filter,
-                    value,
-                ) in vector_search_settings.search_filters.items():
-                    if isinstance(value, uuid.UUID):
-                        vector_search_settings.search_filters[filter] = str(
-                            value
-                        )
-
-                if user and not user.is_superuser:
-                    vector_search_settings.search_filters["user_id"] = str(
-                        user.id
-                    )
+                vector_search_settings = self._scope_search_filters(
+                    vector_search_settings, user
+                )
 
                 completion_start_time = datetime.now()
                 message_id = generate_id_from_label(
@@ -209,16 +229,11 @@ class RetrievalService(Service):
                 # unpack the first result
                 return results[0]
 
+            except R2RException:
+                raise
             except Exception as e:
-                logger.error(f"Pipeline error: {str(e)}")
-                if "NoneType" in str(e):
-                    raise R2RException(
-                        status_code=502,
-                        message="Ollama server not reachable or returned an invalid response",
-                    )
-                raise R2RException(
-                    status_code=500, message="Internal Server Error"
-                )
+                logger.error("Pipeline error: %s", e)
+                raise self._pipeline_error(e) from e
 
     async def stream_rag_response(
         self,
@@ -234,9 +249,7 @@ class RetrievalService(Service):
     ):
         async def stream_response():
             async with manage_run(self.run_manager, "arag"):
-                async for (
-                    chunk
-                ) in await self.pipelines.streaming_rag_pipeline.run(
+                chunks = await self.pipelines.streaming_rag_pipeline.run(
                     input=to_async_generator([query]),
                     run_manager=self.run_manager,
                     vector_search_settings=vector_search_settings,
@@ -246,7 +259,9 @@ class RetrievalService(Service):
                     user=user,
                     *args,
                     **kwargs,
-                ):
+                )
+                # Let the pipeline keep generating while a chunk is being sent
+                async for chunk in buffered_async_generator(chunks):
                     yield chunk
 
         return stream_response()
@@ -268,20 +283,9 @@ class RetrievalService(Service):
             try:
                 t0 = time.time()
 
-                # Transform UUID filters to strings
-                for (
-                    filter,
-                    value,
-                ) in vector_search_settings.search_filters.items():
-                    if isinstance(value, uuid.UUID):
-                        vector_search_settings.search_filters[filter] = str(
-                            value
-                        )
-
-                if user and not user.is_superuser:
-                    vector_search_settings.search_filters["user_id"] = str(
-                        user.id
-                    )
+                vector_search_settings = self._scope_search_filters(
+                    vector_search_settings, user
+                )
 
                 if rag_generation_config.stream:
                     t1 = time.time()
@@ -335,16 +339,11 @@ class RetrievalService(Service):
                 )
                 return results
 
+            except R2RException:
+                raise
             except Exception as e:
-                logger.error(f"Pipeline error: {str(e)}")
-                if "NoneType" in str(e):
-                    raise R2RException(
-                        status_code=502,
-                        message="Ollama server not reachable or returned an invalid response",
-                    )
-                raise R2RException(
-                    status_code=500, message="Internal Server Error"
-                )
+                logger.error("Pipeline error: %s", e)
+                raise self._pipeline_error(e) from e
 
     @telemetry_event("Evaluate")
     async def evaluate(
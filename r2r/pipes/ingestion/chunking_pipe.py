@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any, AsyncGenerator, Optional, Union
 
 from r2r.base import (
@@ -49,6 +48,9 @@ class ChunkingPipe(AsyncPipe):
         *args: Any,
         **kwargs: Any,
     ) -> AsyncGenerator[Union[R2RDocumentProcessingError, Fragment], None]:
+        # Documents such as PDFs arrive as one extraction per page, so
+        # chunk_order keeps counting across a document's extractions
+        chunk_orders: dict[Any, int] = {}
         async for item in input.message:
             if isinstance(item, R2RDocumentProcessingError):
                 yield item
@@ -57,14 +59,16 @@ class ChunkingPipe(AsyncPipe):
             try:
                 iteration = 0
                 async for chunk in self.chunking_provider.chunk(item.data):
+                    chunk_order = chunk_orders.get(item.document_id, 0)
                     yield Fragment(
                         id=generate_id_from_label(f"{item.id}-{iteration}"),
                         type=FragmentType.TEXT,
                         data=chunk,
-                        metadata=item.metadata,
+                        metadata={**item.metadata, "chunk_order": chunk_order},
                         extraction_id=item.id,
                         document_id=item.document_id,
                     )
+                    chunk_orders[item.document_id] = chunk_order + 1
                     iteration += 1
             except Exception as e:
                 yield R2RDocumentProcessingError(
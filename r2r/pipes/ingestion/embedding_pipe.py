@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Any, AsyncGenerator, Optional, Union
+from typing import Any, AsyncGenerator, Awaitable, Optional, Union
 
 from r2r.base import (
     AsyncState,
@@ -11,6 +11,7 @@ from r2r.base import (
     R2RDocumentProcessingError,
     Vector,
     VectorEntry,
+    bounded_gather,
 )
 from r2r.base.pipes.base_pipe import AsyncPipe
 
@@ -47,10 +48,15 @@ class EmbeddingPipe(AsyncPipe):
         self.embedding_batch_size = embedding_batch_size
 
     async def embed(self, fragments: list[Fragment]) -> list[float]:
-        return await self.embedding_provider.async_get_embeddings(
-            [fragment.data for fragment in fragments],
-            EmbeddingProvider.PipeStage.BASE,
+        # Repeated chunks (headers, boilerplate) are only embedded once
+        unique_texts = list(dict.fromkeys(f.data for f in fragments))
+        vectors = await self.embedding_provider.async_get_embeddings(
+            unique_texts, EmbeddingProvider.PipeStage.BASE
         )
+        if len(unique_texts) == len(fragments):
+            return vectors
+        vectors_by_text = dict(zip(unique_texts, vectors))
+        return [vectors_by_text[fragment.data] for fragment in fragments]
 
     async def _process_batch(
         self, fragment_batch: list[Fragment]
@@ -70,44 +76,50 @@ class EmbeddingPipe(AsyncPipe):
             for raw_vector, fragment in zip(vectors, fragment_batch)
         ]
 
-    async def _run_logic(
-        self,
-        input: Input,
-        state: AsyncState,
-        run_id: Any,
-        *args: Any,
-        **kwargs: Any,
-    ) -> AsyncGenerator[Union[R2RDocumentProcessingError, VectorEntry], None]:
-        fragment_batch = []
+    async def _embed_batch(
+        self, fragment_batch: list[Fragment]
+    ) -> list[Union[R2RDocumentProcessingError, VectorEntry]]:
+        try:
+            return await self._process_batch(fragment_batch)
+        except Exception as e:
+            logger.error(f"Error processing batch: {e}")
+            return [
+                R2RDocumentProcessingError(
+                    error_message=str(e),
+                    document_id=fragment_batch[0].document_id,
+                )
+            ]
 
+    async def _batches(
+        self, input: Input
+    ) -> AsyncGenerator[Awaitable[list], None]:
+        fragment_batch = []
         async for item in input.message:
             if isinstance(item, R2RDocumentProcessingError):
-                yield item
+                yield asyncio.sleep(0, result=[item])
                 continue
 
             fragment_batch.append(item)
             if len(fragment_batch) >= self.embedding_batch_size:
-                try:
-                    for vector_entry in await self._process_batch(
-                        fragment_batch
-                    ):
-                        yield vector_entry
-                except Exception as e:
-                    logger.error(f"Error processing batch: {e}")
-                    yield R2RDocumentProcessingError(
-                        error_message=str(e),
-                        document_id=fragment_batch[0].document_id,
-                    )
-                finally:
-                    fragment_batch.clear()
+                yield self._embed_batch(fragment_batch)
+                fragment_batch = []
 
         if fragment_batch:
-            try:
-                for vector_entry in await self._process_batch(fragment_batch):
-                    yield vector_entry
-            except Exception as e:
-                logger.error(f"Error processing final batch: {e}")
-                yield R2RDocumentProcessingError(
-                    error_message=str(e),
-                    document_id=fragment_batch[0].document_id,
-                )
+            yield self._embed_batch(fragment_batch)
+
+    async def _run_logic(
+        self,
+        input: Input,
+        state: AsyncState,
+        run_id: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Union[R2RDocumentProcessingError, VectorEntry], None]:
+        # Batches are embedded concurrently, up to the provider's request
+        # limit, and results are yielded in input order
+        async for results in bounded_gather(
+            self._batches(input),
+            limit=self.embedding_provider.config.concurrent_request_limit,
+        ):
+            for result in results:
+                yield result
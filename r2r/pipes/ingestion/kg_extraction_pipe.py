@@ -1,20 +1,21 @@
 import asyncio
 import json
 import logging
-from typing import Any, AsyncGenerator, Optional, Union
+import random
+from typing import Any, AsyncGenerator, Awaitable, Optional, Union
 
 from r2r.base import (
     AsyncState,
     ChunkingProvider,
     CompletionProvider,
     Extraction,
-    Fragment,
     KGExtraction,
     KGProvider,
     KVLoggingSingleton,
     PipeType,
     PromptProvider,
     R2RDocumentProcessingError,
+    bounded_gather,
     extract_entities,
     extract_triples,
 )
@@ -78,6 +79,7 @@ class KGExtractionPipe(AsyncPipe):
             task_inputs={"input": fragment},
         )
         for attempt in range(retries):
+            kg_extraction = None
             try:
                 response = await self.llm_provider.aget_completion(
                     messages, self.kg_provider.config.kg_extraction_config
@@ -100,18 +102,36 @@ class KGExtractionPipe(AsyncPipe):
                 triples = extract_triples(llm_payload, entities)
 
                 # Create KG extraction object
-                return KGExtraction(entities=entities, triples=triples)
-            except (
-                ClientError,
-                json.JSONDecodeError,
-                KeyError,
-                IndexError,
-            ) as e:
+                return KGExtraction.model_construct(
+                    entities=entities, triples=triples
+                )
+            except ClientError as e:
                 logger.error(f"Error in extract_kg: {e}")
                 if attempt < retries - 1:
-                    await asyncio.sleep(delay)
+                    # Jittered exponential backoff, so throttled workers do
+                    # not all retry at the same moment
+                    await asyncio.sleep(
+                        delay * 2**attempt * (0.5 + random.random())
+                    )
                 else:
                     logger.error(f"Failed after retries with {e}")
+            except (json.JSONDecodeError, KeyError, IndexError) as e:
+                # A malformed response will not improve by waiting; show
+                # the model what it sent and ask it to correct the format
+                logger.error(f"Error in extract_kg: {e}")
+                if attempt == retries - 1:
+                    logger.error(f"Failed after retries with {e}")
+                elif kg_extraction is not None:
+                    messages = [
+                        *messages,
+                        {"role": "assistant", "content": kg_extraction},
+                        {
+                            "role": "user",
+                            "content": "Your previous response was malformed "
+                            f"({e}). Reply again with only the JSON object "
+                            "in the requested format.",
+                        },
+                    ]
 
         return KGExtraction(entities={}, triples=[])
 
@@ -127,48 +147,75 @@ class KGExtractionPipe(AsyncPipe):
         ]
         return await asyncio.gather(*tasks)
 
-    async def _run_logic(
-        self,
-        input: Input,
-        state: AsyncState,
-        run_id: Any,
-        *args: Any,
-        **kwargs: Any,
-    ) -> AsyncGenerator[Union[KGExtraction, R2RDocumentProcessingError], None]:
-        fragment_batch = []
+    async def _extract_batch(
+        self, fragment_batch: list[Any], document_ids: list[Any]
+    ) -> list[Union[KGExtraction, R2RDocumentProcessingError]]:
+        try:
+            return await self._process_batch(fragment_batch)
+        except Exception as e:
+            logger.error(f"Error processing batch: {e}")
+            return [
+                R2RDocumentProcessingError(
+                    error_message=str(e),
+                    document_id=document_id,
+                )
+                for document_id in document_ids
+            ]
 
+    async def _batches(
+        self, input: Input
+    ) -> AsyncGenerator[Awaitable[list], None]:
+        fragment_batch = []
+        # A batch can span documents; a failure is reported for each one
+        document_ids: dict[Any, None] = {}
         async for item in input.message:
             if isinstance(item, R2RDocumentProcessingError):
-                yield item
+                yield asyncio.sleep(0, result=[item])
                 continue
 
             try:
                 async for chunk in self.chunking_provider.chunk(item.data):
                     fragment_batch.append(chunk)
+                    document_ids[item.document_id] = None
                     if len(fragment_batch) >= self.kg_batch_size:
-                        for kg_extraction in await self._process_batch(
-                            fragment_batch
-                        ):
-                            yield kg_extraction
-                        fragment_batch.clear()
+                        yield self._extract_batch(
+                            fragment_batch, list(document_ids)
+                        )
+                        fragment_batch = []
+                        document_ids = {}
             except Exception as e:
                 logger.error(f"Error processing document: {e}")
-                yield R2RDocumentProcessingError(
-                    error_message=str(e),
-                    document_id=item.document_id,
+                yield asyncio.sleep(
+                    0,
+                    result=[
+                        R2RDocumentProcessingError(
+                            error_message=str(e),
+                            document_id=item.document_id,
+                        )
+                    ],
                 )
 
         if fragment_batch:
-            try:
-                for kg_extraction in await self._process_batch(fragment_batch):
-                    yield kg_extraction
-            except Exception as e:
-                logger.error(f"Error processing final batch: {e}")
-                yield R2RDocumentProcessingError(
-                    error_message=str(e),
-                    document_id=(
-                        fragment_batch[0].document_id
-                        if fragment_batch
-                        else None
-                    ),
-                )
+            yield self._extract_batch(fragment_batch, list(document_ids))
+
+    async def _run_logic(
+        self,
+        input: Input,
+        state: AsyncState,
+        run_id: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Union[KGExtraction, R2RDocumentProcessingError], None]:
+        # Batches are extracted concurrently so that roughly the LLM
+        # provider's concurrency limit of requests is in flight, and
+        # results keep input order
+        async for results in bounded_gather(
+            self._batches(input),
+            limit=max(
+                1,
+                self.llm_provider.config.concurrency_limit
+                // self.kg_batch_size,
+            ),
+        ):
+            for result in results:
+                yield result
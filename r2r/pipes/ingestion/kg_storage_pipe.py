@@ -58,35 +58,42 @@ class KGStoragePipe(AsyncPipe):
         Stores a batch of knowledge graph extractions in the graph database.
         """
         try:
-            nodes = []
-            relations = []
-            for extraction in kg_extractions:
-                for entity in extraction.entities.values():
-                    embedding = None
-                    if self.embedding_provider:
-                        embedding = self.embedding_provider.get_embedding(
-                            f"Entity:\n{entity.value}\nLabel:\n{entity.category}\nSubcategory:\n{entity.subcategory}"
-                        )
-                    nodes.append(
-                        EntityNode(
-                            name=entity.value,
-                            label=entity.category,
-                            embedding=embedding,
-                            properties=(
-                                {"subcategory": entity.subcategory}
-                                if entity.subcategory
-                                else {}
-                            ),
-                        )
-                    )
-                for triple in extraction.triples:
-                    relations.append(
-                        Relation(
-                            source_id=triple.subject,
-                            target_id=triple.object,
-                            label=triple.predicate,
-                        )
-                    )
+            entities = [
+                entity
+                for extraction in kg_extractions
+                for entity in extraction.entities.values()
+            ]
+            embeddings = [None] * len(entities)
+            if self.embedding_provider and entities:
+                # Embed the whole batch at once rather than one entity at a time
+                embeddings = await self.embedding_provider.async_get_embeddings(
+                    [
+                        f"Entity:\n{entity.value}\nLabel:\n{entity.category}\nSubcategory:\n{entity.subcategory}"
+                        for entity in entities
+                    ]
+                )
+            nodes = [
+                EntityNode(
+                    name=entity.value,
+                    label=entity.category,
+                    embedding=embedding,
+                    properties=(
+                        {"subcategory": entity.subcategory}
+                        if entity.subcategory
+                        else {}
+                    ),
+                )
+                for entity, embedding in zip(entities, embeddings)
+            ]
+            relations = [
+                Relation(
+                    source_id=triple.subject,
+                    target_id=triple.object,
+                    label=triple.predicate,
+                )
+                for extraction in kg_extractions
+                for triple in extraction.triples
+            ]
             self.kg_provider.upsert_nodes(nodes)
             self.kg_provider.upsert_relations(relations)
         except Exception as e:
@@ -2,19 +2,13 @@
 This module contains the `DocumentParsingPipe` class, which is responsible for parsing incoming documents into plaintext.
 """
 
-import asyncio
-import logging
-import time
 import uuid
 from typing import AsyncGenerator, Optional, Union
 
-from r2r import parsers
 from r2r.base import (
     AsyncState,
     Document,
-    DocumentType,
     Extraction,
-    ExtractionType,
     KVLoggingSingleton,
     ParsingProvider,
     PipeType,
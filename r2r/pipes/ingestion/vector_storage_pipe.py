@@ -57,10 +57,17 @@ class VectorStoragePipe(AsyncPipe):
         """
 
         try:
+            # The write is synchronous; run it off the event loop so storing
+            # one batch overlaps with embedding the next
             if do_upsert:
-                self.database_provider.vector.upsert_entries(vector_entries)
+                await asyncio.to_thread(
+                    self.database_provider.vector.upsert_entries,
+                    vector_entries,
+                )
             else:
-                self.database_provider.vector.copy_entries(vector_entries)
+                await asyncio.to_thread(
+                    self.database_provider.vector.copy_entries, vector_entries
+                )
         except Exception as e:
             error_message = (
                 f"Failed to store vector entries in the database: {e}"
@@ -104,16 +111,16 @@ class VectorStoragePipe(AsyncPipe):
                 # Schedule the storage task
                 batch_tasks.append(
                     asyncio.create_task(
-                        self.store(vector_batch.copy(), input.do_upsert),
+                        self.store(vector_batch, input.do_upsert),
                         name=f"vector-store-{self.config.name}",
                     )
                 )
-                vector_batch.clear()
+                vector_batch = []
 
         if vector_batch:  # Process any remaining vectors
             batch_tasks.append(
                 asyncio.create_task(
-                    self.store(vector_batch.copy(), input.do_upsert),
+                    self.store(vector_batch, input.do_upsert),
                     name=f"vector-store-{self.config.name}",
                 )
             )
@@ -1,4 +1,5 @@
 import logging
+import re
 import uuid
 from typing import Any, Optional
 
@@ -16,6 +17,8 @@ from ..abstractions.generator_pipe import GeneratorPipe
 
 logger = logging.getLogger(__name__)
 
+_CYPHER_BLOCK_PATTERN = re.compile(r"```cypher(.*?)(?:```|\Z)", re.DOTALL)
+
 
 class KGSearchSearchPipe(GeneratorPipe):
     """
@@ -85,7 +88,13 @@ class KGSearchSearchPipe(GeneratorPipe):
             )
 
             extraction = result.choices[0].message.content
-            query = extraction.split("```cypher")[1].split("```")[0]
+            match = _CYPHER_BLOCK_PATTERN.search(extraction)
+            if match is None:
+                logger.warning(
+                    "No cypher query found in the KG search response."
+                )
+                continue
+            query = match.group(1)
             result = self.kg_provider.structured_query(query)
             yield (query, result)
 
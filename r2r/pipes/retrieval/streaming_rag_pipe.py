@@ -79,18 +79,18 @@ class StreamingSearchRAGPipe(SearchRAGPipe):
             )
             yield f"<{self.COMPLETION_STREAM_MARKER}>"
 
-            response = ""
+            response_chunks = []
             for chunk in self.llm_provider.get_completion_stream(
                 messages=messages, generation_config=rag_generation_config
             ):
                 chunk = StreamingSearchRAGPipe._process_chunk(chunk)
-                response += chunk
+                response_chunks.append(chunk)
                 yield chunk
 
             yield f"</{self.COMPLETION_STREAM_MARKER}>"
 
             completion_record.search_results = search_results
-            completion_record.llm_response = response
+            completion_record.llm_response = "".join(response_chunks)
             completion_record.completion_end_time = datetime.now()
             await self.log_completion_record(run_id, completion_record)
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import uuid
@@ -56,19 +57,23 @@ class VectorSearchPipe(SearchPipe):
             vector_search_settings.search_limit or self.config.search_limit
         )
         results = []
-        query_vector = self.embedding_provider.get_embedding(
+        # Neither the embedding request nor the database query may block the
+        # loop, so concurrent searches overlap instead of running in turn
+        query_vector = await self.embedding_provider.async_get_embedding(
             message,
             purpose=EmbeddingPurpose.QUERY,
         )
         search_results = (
-            self.database_provider.vector.hybrid_search(
+            await asyncio.to_thread(
+                self.database_provider.vector.hybrid_search,
                 query_vector=query_vector,
                 query_text=message,
                 filters=search_filters,
                 limit=search_limit,
             )
             if vector_search_settings.do_hybrid_search
-            else self.database_provider.vector.search(
+            else await asyncio.to_thread(
+                self.database_provider.vector.search,
                 query_vector=query_vector,
                 filters=search_filters,
                 limit=search_limit,
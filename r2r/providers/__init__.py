@@ -1,22 +1,70 @@
-from .auth import R2RAuthProvider
-from .chunking import R2RChunkingProvider, UnstructuredChunkingProvider
-from .crypto import BCryptConfig, BCryptProvider
-from .database import PostgresDBProvider
-from .embeddings import (
-    LiteLLMEmbeddingProvider,
-    OllamaEmbeddingProvider,
-    OpenAIEmbeddingProvider,
-)
-from .eval import LLMEvalProvider
-from .kg import Neo4jKGProvider
-from .llm import LiteCompletionProvider, OpenAICompletionProvider
-from .parsing import R2RParsingProvider, UnstructuredParsingProvider
-from .prompts import R2RPromptProvider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .auth import R2RAuthProvider
+    from .chunking import R2RChunkingProvider, UnstructuredChunkingProvider
+    from .crypto import (
+        Argon2Config,
+        Argon2Provider,
+        BCryptConfig,
+        BCryptProvider,
+    )
+    from .database import PostgresDBProvider
+    from .embeddings import (
+        LiteLLMEmbeddingProvider,
+        OllamaEmbeddingProvider,
+        OpenAIEmbeddingProvider,
+    )
+    from .eval import LLMEvalProvider
+    from .kg import Neo4jKGProvider
+    from .llm import LiteCompletionProvider, OpenAICompletionProvider
+    from .parsing import R2RParsingProvider, UnstructuredParsingProvider
+    from .prompts import R2RPromptProvider
+
+# Providers pull in heavy client libraries (litellm, openai, neo4j, ...), so
+# each one is imported from its subpackage on first access (PEP 562).
+_LAZY_IMPORTS = {
+    "R2RAuthProvider": ".auth",
+    "R2RChunkingProvider": ".chunking",
+    "UnstructuredChunkingProvider": ".chunking",
+    "Argon2Config": ".crypto",
+    "Argon2Provider": ".crypto",
+    "BCryptConfig": ".crypto",
+    "BCryptProvider": ".crypto",
+    "PostgresDBProvider": ".database",
+    "LiteLLMEmbeddingProvider": ".embeddings",
+    "OllamaEmbeddingProvider": ".embeddings",
+    "OpenAIEmbeddingProvider": ".embeddings",
+    "LLMEvalProvider": ".eval",
+    "Neo4jKGProvider": ".kg",
+    "LiteCompletionProvider": ".llm",
+    "OpenAICompletionProvider": ".llm",
+    "R2RParsingProvider": ".parsing",
+    "UnstructuredParsingProvider": ".parsing",
+    "R2RPromptProvider": ".prompts",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "R2RAuthProvider",
     "BCryptProvider",
     "BCryptConfig",
+    "Argon2Provider",
+    "Argon2Config",
     "PostgresDBProvider",
     "LiteLLMEmbeddingProvider",
     "OllamaEmbeddingProvider",
@@ -1,5 +1,9 @@
 import logging
 import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Dict
 
@@ -23,6 +27,8 @@ logger = logging.getLogger(__name__)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 DEFAULT_R2R_SK = "wNFbczH3QhUVcPALwtWZCPi0lrDlGV3P1DPRVEQCPbM"
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_SIZE = 1024
 
 
 class R2RAuthProvider(AuthProvider):
@@ -47,6 +53,16 @@ class R2RAuthProvider(AuthProvider):
             config.refresh_token_lifetime_in_days
             or os.getenv("R2R_REFRESH_LIFE_IN_MINUTES")
         )
+        # Resolved users keyed on the raw token, so repeat requests from one
+        # session skip the JWT decode and user query. The cache is per
+        # process: the blacklist is still checked on every hit, but user
+        # updates made through another worker show up only after the TTL.
+        # A TTL of 0 disables the cache.
+        self.user_cache_ttl_seconds = config.extra_fields.get(
+            "user_cache_ttl_seconds", USER_CACHE_TTL_SECONDS
+        )
+        self._user_cache: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self._user_cache_lock = threading.Lock()
         try:
             user = self.register(
                 UserCreate(
@@ -105,14 +121,53 @@ class R2RAuthProvider(AuthProvider):
             raise R2RException(status_code=401, message="Invalid token") from e
 
     def user(self, token: str = Depends(oauth2_scheme)) -> User:
+        with self._user_cache_lock:
+            cached = self._user_cache.get(token)
+            if cached is not None:
+                expires_at, user = cached
+                if expires_at > time.monotonic():
+                    self._user_cache.move_to_end(token)
+                else:
+                    del self._user_cache[token]
+                    cached = None
+
+        if cached is not None:
+            if self.db_provider.relational.is_token_blacklisted(token):
+                self._invalidate_token(token)
+                raise R2RException(
+                    status_code=401, message="Token has been invalidated"
+                )
+            return user
+
         token_data = self.decode_token(token)
         user = self.db_provider.relational.get_user_by_email(token_data.email)
         if user is None:
             raise R2RException(
                 status_code=401, message="Invalid authentication credentials"
             )
+
+        ttl = min(
+            self.user_cache_ttl_seconds,
+            (token_data.exp - datetime.now(timezone.utc)).total_seconds(),
+        )
+        if ttl > 0:
+            with self._user_cache_lock:
+                self._user_cache[token] = (time.monotonic() + ttl, user)
+                self._user_cache.move_to_end(token)
+                if len(self._user_cache) > USER_CACHE_MAX_SIZE:
+                    self._user_cache.popitem(last=False)
         return user
 
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        with self._user_cache_lock:
+            for token, (_, user) in list(self._user_cache.items()):
+                if user.id == user_id:
+                    del self._user_cache[token]
+
+    def _invalidate_token(self, token: str) -> None:
+        with self._user_cache_lock:
+            self._user_cache.pop(token, None)
+
     def get_current_active_user(
         self, current_user: User = Depends(user)
     ) -> User:
@@ -205,6 +260,11 @@ class R2RAuthProvider(AuthProvider):
             logger.warning(f"Unverified user attempted login: {email}")
             raise R2RException(status_code=401, message="Email not verified")
 
+        if self.crypto_provider.needs_rehash(user.hashed_password):
+            self.db_provider.relational.update_user_password(
+                user.id, self.crypto_provider.get_password_hash(password)
+            )
+
         logger.info(f"Successful login for user: {email}")
         access_token = self.create_access_token(data={"sub": user.email})
         refresh_token = self.create_refresh_token(data={"sub": user.email})
@@ -229,6 +289,7 @@ class R2RAuthProvider(AuthProvider):
 
         # Invalidate the old refresh token and create a new one
         self.db_provider.relational.blacklist_token(refresh_token)
+        self._invalidate_token(refresh_token)
 
         new_access_token = self.create_access_token(
             data={"sub": token_data.email}
@@ -259,6 +320,7 @@ class R2RAuthProvider(AuthProvider):
         self.db_provider.relational.update_user_password(
             user.id, hashed_new_password
         )
+        self.invalidate_user(user.id)
         return {"message": "Password changed successfully"}
 
     def request_password_reset(self, email: str) -> Dict[str, str]:
@@ -298,11 +360,13 @@ class R2RAuthProvider(AuthProvider):
             user_id, hashed_new_password
         )
         self.db_provider.relational.remove_reset_token(user_id)
+        self.invalidate_user(user_id)
         return {"message": "Password reset successfully"}
 
     def logout(self, token: str) -> Dict[str, str]:
         # Add the token to a blacklist
         self.db_provider.relational.blacklist_token(token)
+        self._invalidate_token(token)
         return {"message": "Logged out successfully"}
 
     def clean_expired_blacklisted_tokens(self):
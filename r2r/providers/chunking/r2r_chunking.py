@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, AsyncGenerator
 
 from r2r.base import (
@@ -24,7 +25,10 @@ class R2RChunkingProvider(ChunkingProvider):
 
     async def chunk(self, parsed_document: Any) -> AsyncGenerator[Any, None]:
         if isinstance(parsed_document, str):
-            chunks = self.text_splitter.create_documents([parsed_document])
+            # Splitting is CPU-bound; keep large documents off the event loop
+            chunks = await asyncio.to_thread(
+                self.text_splitter.split_text, parsed_document
+            )
         else:
             # Assuming parsed_document is already a list of text chunks
             chunks = parsed_document
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, AsyncGenerator
 
 from r2r.base import ChunkingProvider
@@ -23,21 +24,18 @@ class UnstructuredChunkingProvider(ChunkingProvider):
         super().__init__(config)
 
     async def chunk(self, parsed_document: str) -> AsyncGenerator[str, None]:
-        if self.config.method == "by_title":
-            chunks = self.chunk_by_title(
-                [self.Text(text=parsed_document)],
-                max_characters=self.config.chunk_size,
-                new_after_n_chars=self.config.max_chunk_size
-                or self.config.chunk_size,
-                overlap=self.config.chunk_overlap,
-            )
-        else:
-            chunks = self.chunk_elements(
-                [self.Text(text=parsed_document)],
-                max_characters=self.config.chunk_size,
-                new_after_n_chars=self.config.max_chunk_size
-                or self.config.chunk_size,
-                overlap=self.config.chunk_overlap,
-            )
+        chunk_fn = (
+            self.chunk_by_title
+            if self.config.method == "by_title"
+            else self.chunk_elements
+        )
+        chunks = await asyncio.to_thread(
+            chunk_fn,
+            [self.Text(text=parsed_document)],
+            max_characters=self.config.chunk_size,
+            new_after_n_chars=self.config.max_chunk_size
+            or self.config.chunk_size,
+            overlap=self.config.chunk_overlap,
+        )
         for chunk in chunks:
             yield chunk.text
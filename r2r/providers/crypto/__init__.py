@@ -1,3 +1,4 @@
+from .argon2 import Argon2Config, Argon2Provider
 from .bcrypt import BCryptConfig, BCryptProvider
 
-__all__ = ["BCryptProvider", "BCryptConfig"]
+__all__ = ["Argon2Provider", "Argon2Config", "BCryptProvider", "BCryptConfig"]
@@ -0,0 +1,79 @@
+import secrets
+import string
+
+from r2r.base import CryptoConfig, CryptoProvider
+
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+class Argon2Config(CryptoConfig):
+    time_cost: int = 3
+    memory_cost: int = 65536  # KiB
+    parallelism: int = 4
+    hash_len: int = 32
+    salt_len: int = 16
+
+    def validate(self) -> None:
+        super().validate()
+        if self.time_cost < 1:
+            raise ValueError("time_cost must be at least 1")
+        if self.parallelism < 1:
+            raise ValueError("parallelism must be at least 1")
+        if self.memory_cost < 8 * self.parallelism:
+            raise ValueError("memory_cost must be at least 8 * parallelism")
+
+
+class Argon2Provider(CryptoProvider):
+    def __init__(self, config: Argon2Config):
+        try:
+            from argon2 import PasswordHasher, Type
+            from argon2.exceptions import InvalidHashError, VerificationError
+
+            self.verify_errors = (InvalidHashError, VerificationError)
+        except ImportError:
+            raise ImportError(
+                "Please install argon2-cffi to use Argon2Provider: "
+                "pip install 'r2r[crypto-argon2]'"
+            )
+
+        if not isinstance(config, Argon2Config):
+            raise ValueError(
+                "Argon2Provider must be initialized with an Argon2Config"
+            )
+        super().__init__(config)
+        self.hasher = PasswordHasher(
+            time_cost=config.time_cost,
+            memory_cost=config.memory_cost,
+            parallelism=config.parallelism,
+            hash_len=config.hash_len,
+            salt_len=config.salt_len,
+            type=Type.ID,
+        )
+
+    def get_password_hash(self, password: str) -> str:
+        return self.hasher.hash(password)
+
+    def verify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        if hashed_password.startswith(BCRYPT_PREFIXES):
+            # Accounts created under BCryptProvider; rehashed on next login
+            import bcrypt
+
+            return bcrypt.checkpw(
+                plain_password.encode("utf-8"),
+                hashed_password.encode("utf-8"),
+            )
+        try:
+            return self.hasher.verify(hashed_password, plain_password)
+        except self.verify_errors:
+            return False
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return hashed_password.startswith(
+            BCRYPT_PREFIXES
+        ) or self.hasher.check_needs_rehash(hashed_password)
+
+    def generate_verification_code(self, length: int = 32) -> str:
+        alphabet = string.ascii_letters + string.digits
+        return "".join(secrets.choice(alphabet) for _ in range(length))
@@ -5,6 +5,8 @@ from r2r.base import CryptoConfig, CryptoProvider
 
 
 class BCryptConfig(CryptoConfig):
+    # Each extra round doubles the cost; 12 is ~250ms per hash on a
+    # typical server core
     salt_rounds: int = 12
 
     def validate(self) -> None:
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import os
@@ -29,6 +30,21 @@ from .vecs import Client, Collection, create_client
 logger = logging.getLogger(__name__)
 
 
+def _pool_size(config: DatabaseConfig) -> int:
+    # vecs defaults to a single pooled connection; concurrent requests would
+    # otherwise open and close an overflow connection on every checkout
+    return int(
+        config.extra_fields.get("pool_size", None)
+        or os.getenv("POSTGRES_POOL_SIZE", 16)
+    )
+
+
+def _hash_token(token: Optional[str]) -> Optional[str]:
+    # One-time codes are stored and matched as fixed-width digests, so the
+    # lookup never compares the caller's raw input against a stored secret
+    return hashlib.sha256(token.encode()).hexdigest() if token else None
+
+
 class PostgresVectorDBProvider(VectorDatabaseProvider):
     def __init__(self, config: DatabaseConfig, *args, **kwargs):
         super().__init__(config)
@@ -113,7 +129,9 @@ class PostgresVectorDBProvider(VectorDatabaseProvider):
 
         # The rest of the initialization remains the same
         try:
-            self.vx: Client = create_client(DB_CONNECTION)
+            self.vx: Client = create_client(
+                DB_CONNECTION, pool_size=_pool_size(self.config)
+            )
         except Exception as e:
             raise ValueError(
                 f"Error {e} occurred while attempting to connect to the pgvector provider with {DB_CONNECTION}."
@@ -540,30 +558,36 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
     def upsert_documents_overview(
         self, documents_overview: list[DocumentInfo]
     ) -> None:
+        if not documents_overview:
+            return
+
+        db_entries = []
         for document_info in documents_overview:
             db_entry = document_info.convert_to_db_entry()
 
             # Convert 'None' string to None type for user_id
             if db_entry["user_id"] == "None":
                 db_entry["user_id"] = None
+            db_entries.append(db_entry)
 
-            query = text(
-                f"""
-                INSERT INTO document_info_{self.collection_name} (document_id, title, user_id, version, created_at, updated_at, size_in_bytes, metadata, status)
-                VALUES (:document_id, :title, :user_id, :version, :created_at, :updated_at, :size_in_bytes, :metadata, :status)
-                ON CONFLICT (document_id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    user_id = EXCLUDED.user_id,
-                    version = EXCLUDED.version,
-                    updated_at = EXCLUDED.updated_at,
-                    size_in_bytes = EXCLUDED.size_in_bytes,
-                    metadata = EXCLUDED.metadata,
-                    status = EXCLUDED.status;
-            """
-            )
-            with self.vx.Session() as sess:
-                sess.execute(query, db_entry)
-                sess.commit()
+        query = text(
+            f"""
+            INSERT INTO document_info_{self.collection_name} (document_id, title, user_id, version, created_at, updated_at, size_in_bytes, metadata, status)
+            VALUES (:document_id, :title, :user_id, :version, :created_at, :updated_at, :size_in_bytes, :metadata, :status)
+            ON CONFLICT (document_id) DO UPDATE SET
+                title = EXCLUDED.title,
+                user_id = EXCLUDED.user_id,
+                version = EXCLUDED.version,
+                updated_at = EXCLUDED.updated_at,
+                size_in_bytes = EXCLUDED.size_in_bytes,
+                metadata = EXCLUDED.metadata,
+                status = EXCLUDED.status;
+        """
+        )
+        # One executemany and one commit for the whole batch
+        with self.vx.Session() as sess:
+            sess.execute(query, db_entries)
+            sess.commit()
 
     def delete_from_documents_overview(
         self, document_id: str, version: Optional[str] = None
@@ -583,36 +607,44 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
                 sess.execute(text(query), params)
             sess.commit()
 
+    def delete_many_from_documents_overview(
+        self, document_ids: list[str]
+    ) -> None:
+        if not document_ids:
+            return
+
+        query = f"""
+            DELETE FROM document_info_{self.collection_name}
+            WHERE document_id = ANY(CAST(:document_ids AS UUID[]))
+        """
+        params = {
+            "document_ids": [str(document_id) for document_id in document_ids]
+        }
+
+        with self.vx.Session() as sess:
+            sess.execute(text(query), params)
+            sess.commit()
+
     def get_documents_overview(
         self,
-        filter_document_ids: Optional[list[str]] = None,
-        filter_user_ids: Optional[list[str]] = None,
+        filter_document_ids: Optional[list[UUID]] = None,
+        filter_user_ids: Optional[list[UUID]] = None,
     ):
         conditions = []
         params = {}
 
+        # Ids are bound as single arrays, so the statement text is the same
+        # for any number of ids and both filters apply in one indexed scan
         if filter_document_ids:
-            placeholders = ", ".join(
-                f":doc_id_{i}" for i in range(len(filter_document_ids))
-            )
-            conditions.append(f"document_id IN ({placeholders})")
-            params.update(
-                {
-                    f"doc_id_{i}": str(document_id)
-                    for i, document_id in enumerate(filter_document_ids)
-                }
+            conditions.append(
+                "document_id = ANY(CAST(:document_ids AS UUID[]))"
             )
+            params["document_ids"] = [
+                str(document_id) for document_id in filter_document_ids
+            ]
         if filter_user_ids:
-            placeholders = ", ".join(
-                f":user_id_{i}" for i in range(len(filter_user_ids))
-            )
-            conditions.append(f"user_id IN ({placeholders})")
-            params.update(
-                {
-                    f"user_id_{i}": str(user_id)
-                    for i, user_id in enumerate(filter_user_ids)
-                }
-            )
+            conditions.append("user_id = ANY(CAST(:user_ids AS UUID[]))")
+            params["user_ids"] = [str(user_id) for user_id in filter_user_ids]
 
         query = f"""
             SELECT document_id, title, user_id, version, size_in_bytes, created_at, updated_at, metadata, status
@@ -639,7 +671,7 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
             ]
 
     # TODO - Deprecate this method
-    def get_users_overview(self, user_ids: Optional[list[str]] = None):
+    def get_users_overview(self, user_ids: Optional[list[UUID]] = None):
         user_ids_condition = ""
         params = {}
         if user_ids:
@@ -744,7 +776,7 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
             sess.execute(
                 query,
                 {
-                    "code": verification_code,
+                    "code": _hash_token(verification_code),
                     "expiry": expiry,
                     "user_id": user_id,
                 },
@@ -762,7 +794,9 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
         )
 
         with self.vx.Session() as sess:
-            result = sess.execute(query, {"code": verification_code})
+            result = sess.execute(
+                query, {"code": _hash_token(verification_code)}
+            )
             user_data = result.fetchone()
 
         return user_data[0] if user_data else None
@@ -803,7 +837,7 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
         )
 
         with self.vx.Session() as sess:
-            sess.execute(query, {"code": verification_code})
+            sess.execute(query, {"code": _hash_token(verification_code)})
             sess.commit()
 
     def delete_user(self, user_id: UUID):
@@ -871,7 +905,7 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
             sess.execute(
                 query,
                 {
-                    "token": reset_token,
+                    "token": _hash_token(reset_token),
                     "expiry": expiry,
                     "user_id": user_id,
                 },
@@ -887,7 +921,7 @@ class PostgresRelationalDBProvider(RelationalDatabaseProvider):
         )
 
         with self.vx.Session() as sess:
-            result = sess.execute(query, {"token": reset_token})
+            result = sess.execute(query, {"token": _hash_token(reset_token)})
             user_data = result.fetchone()
 
         return user_data[0] if user_data else None
@@ -1114,7 +1148,9 @@ class PostgresDBProvider(DatabaseProvider):
             DB_CONNECTION = (
                 f"postgresql://{user}:{password}@{host}:{port}/{db_name}"
             )
-            self.vx: Client = create_client(DB_CONNECTION)
+            self.vx: Client = create_client(
+                DB_CONNECTION, pool_size=_pool_size(config)
+            )
         except Exception as e:
             raise ValueError(
                 f"Error {e} occurred while attempting to connect to the pgvector provider with {DB_CONNECTION}."
@@ -7,6 +7,7 @@ All public classes, enums, and functions are re-exported by the top level `vecs`
 
 from __future__ import annotations
 
+import json
 import logging
 import time
 from typing import TYPE_CHECKING, List, Optional
@@ -26,6 +27,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _json_serializer():
+    # Encode JSONB values with orjson when the fast-json extra is installed
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps
+
+    def dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the stdlib accepts
+            return json.dumps(obj)
+
+    return dumps
+
+
 class Client:
     """
     The `vecs.Client` class serves as an interface to a PostgreSQL database with pgvector support. It facilitates
@@ -65,6 +83,7 @@ class Client:
             pool_size=pool_size,
             poolclass=QueuePool,
             pool_recycle=300,  # Recycle connections after 5 min
+            json_serializer=_json_serializer(),
         )
         self.meta = MetaData(schema="vecs")
         self.Session = sessionmaker(self.engine)
@@ -23,7 +23,6 @@ from typing import (
     Union,
 )
 
-import psycopg2
 from flupy import flu
 from sqlalchemy import (
     Column,
@@ -431,43 +430,34 @@ class Collection:
         import csv
         import io
         import json
-        import os
-
-        pipeline = flu(records)
-        for record in pipeline:
-            with psycopg2.connect(
-                database=os.getenv("POSTGRES_DBNAME"),
-                user=os.getenv("POSTGRES_USER"),
-                password=os.getenv("POSTGRES_PASSWORD"),
-                host=os.getenv("POSTGRES_HOST"),
-                port=os.getenv("POSTGRES_PORT"),
-            ) as conn:
-                with conn.cursor() as cur:
-                    f = io.StringIO()
-                    id, vec, metadata = record
-
-                    writer = csv.writer(f, delimiter=",", quotechar='"')
-                    writer.writerow(
-                        [
-                            str(id),
-                            [float(ele) for ele in vec],
-                            json.dumps(metadata),
-                        ]
-                    )
-                    f.seek(0)
-                    result = f.getvalue()
 
-                    writer_name = (
-                        f'vecs."{self.table.fullname.split(".")[-1]}"'
-                    )
-                    g = io.StringIO(result)
-                    cur.copy_expert(
-                        f"COPY {writer_name}(id, vec, metadata) FROM STDIN WITH (FORMAT csv)",
-                        g,
-                    )
-                    conn.commit()
-        cur.close()
-        conn.close()
+        # Stream every record through a single COPY on a pooled connection
+        f = io.StringIO()
+        writer = csv.writer(f, delimiter=",", quotechar='"')
+        for id, vec, metadata in records:
+            writer.writerow(
+                [
+                    str(id),
+                    [float(ele) for ele in vec],
+                    json.dumps(metadata),
+                ]
+            )
+        if not f.tell():
+            return None
+        f.seek(0)
+
+        writer_name = f'vecs."{self.table.fullname.split(".")[-1]}"'
+        conn = self.client.engine.raw_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.copy_expert(
+                    f"COPY {writer_name}(id, vec, metadata) FROM STDIN WITH (FORMAT csv)",
+                    f,
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        return None
 
     def upsert(
         self,
@@ -1047,7 +1037,11 @@ def build_filters(json_col: Column, filters: Dict):
                 ):
                     raise FilterError("unknown operator")
 
-                if operator == "$eq" and not hasattr(clause, "__len__"):
+                # Scalar equality, strings included, is written as containment
+                # so the GIN jsonb_path_ops index on metadata can serve it
+                if operator == "$eq" and (
+                    isinstance(clause, str) or not hasattr(clause, "__len__")
+                ):
                     contains_value = cast({key: clause}, postgresql.JSONB)
                     filter_clauses.append(json_col.op("@>")(contains_value))
                 elif operator == "$in":
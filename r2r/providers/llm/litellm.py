@@ -47,9 +47,11 @@ class LiteCompletionProvider(CompletionProvider):
         generation_config = task["generation_config"]
         kwargs = task["kwargs"]
 
-        args = self._get_base_args(generation_config)
-        args["messages"] = messages
-        args = {**args, **kwargs}
+        args = {
+            **self._get_base_args(generation_config),
+            "messages": messages,
+            **kwargs,
+        }
 
         logger.debug(f"Executing async LiteLLM task with args: {args}")
         try:
@@ -65,9 +67,11 @@ class LiteCompletionProvider(CompletionProvider):
         generation_config = task["generation_config"]
         kwargs = task["kwargs"]
 
-        args = self._get_base_args(generation_config)
-        args["messages"] = messages
-        args = {**args, **kwargs}
+        args = {
+            **self._get_base_args(generation_config),
+            "messages": messages,
+            **kwargs,
+        }
 
         logger.debug(f"Executing sync LiteLLM task with args: {args}")
         try:
@@ -46,9 +46,11 @@ class OpenAICompletionProvider(CompletionProvider):
         generation_config = task["generation_config"]
         kwargs = task["kwargs"]
 
-        args = self._get_base_args(generation_config)
-        args["messages"] = messages
-        args = {**args, **kwargs}
+        args = {
+            **self._get_base_args(generation_config),
+            "messages": messages,
+            **kwargs,
+        }
 
         logger.debug(f"Executing async OpenAI task with args: {args}")
         try:
@@ -64,9 +66,11 @@ class OpenAICompletionProvider(CompletionProvider):
         generation_config = task["generation_config"]
         kwargs = task["kwargs"]
 
-        args = self._get_base_args(generation_config)
-        args["messages"] = messages
-        args = {**args, **kwargs}
+        args = {
+            **self._get_base_args(generation_config),
+            "messages": messages,
+            **kwargs,
+        }
 
         logger.debug(f"Executing sync OpenAI task with args: {args}")
         try:
@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 class R2RPromptProvider(PromptProvider):
     def __init__(self, config: PromptConfig = PromptConfig()):
         self.prompts: dict[str, Prompt] = {}
+        # Serialized copies of the prompts, kept in step with every write
+        self.prompt_dicts: dict[str, dict] = {}
         self._load_prompts_from_toml_directory(directory_path=config.file_path)
         super().__init__(config)
 
@@ -59,6 +61,7 @@ class R2RPromptProvider(PromptProvider):
         self.prompts[name] = Prompt(
             name=name, template=template, input_types=input_types
         )
+        self.prompt_dicts[name] = self.prompts[name].dict()
 
     def get_prompt(
         self,
@@ -94,6 +97,10 @@ class R2RPromptProvider(PromptProvider):
             self.prompts[name].template = template
         if input_types:
             self.prompts[name].input_types = input_types
+        self.prompt_dicts[name] = self.prompts[name].dict()
 
     def get_all_prompts(self) -> dict[str, Prompt]:
         return self.prompts
+
+    def get_all_prompts_dict(self) -> dict[str, dict]:
+        return self.prompt_dicts
@@ -7,13 +7,17 @@ import pytest
 from r2r import (
     AsyncPipe,
     AsyncState,
+    AsyncSyncMeta,
     Prompt,
     Vector,
     VectorEntry,
     VectorSearchRequest,
     VectorSearchResult,
     VectorType,
+    bounded_gather,
+    buffered_async_generator,
     generate_id_from_label,
+    syncable,
 )
 from r2r.base.abstractions.completion import CompletionRecord, MessageType
 from r2r.base.abstractions.search import AggregateSearchResult
@@ -188,6 +192,14 @@ def test_completion_record_optional_fields():
     assert record.llm_response is None
 
 
+def test_completion_record_timestamp_is_per_instance():
+    before = datetime.now()
+    record = CompletionRecord(
+        message_id=uuid.uuid4(), message_type=MessageType.USER
+    )
+    assert record.timestamp >= before
+
+
 def test_completion_record_to_dict():
     search_results = AggregateSearchResult(vector_search_results=[])
     record = CompletionRecord(
@@ -283,3 +295,118 @@ def test_completion_record_with_complex_search_results():
     assert record_dict["search_results"]["vector_search_results"][0][
         "metadata"
     ] == {"key": "value"}
+
+
+def test_extract_entities():
+    from r2r.base.abstractions.document import extract_entities
+
+    entities = extract_entities(
+        [
+            "[1], PERSON:Aristotle",
+            "[2], ORGANIZATION:SCHOOL:Lyceum: Athens",
+            "[3], malformed",
+            "[1] FOUNDED [2]",
+        ]
+    )
+    assert set(entities.keys()) == {"[1]", "[2]"}
+    assert entities["[1]"].category == "PERSON"
+    assert entities["[1]"].subcategory is None
+    assert entities["[1]"].value == "Aristotle"
+    assert entities["[2]"].subcategory == "SCHOOL"
+    assert entities["[2]"].value == "Lyceum: Athens"
+    assert len({entities["[1]"], entities["[1]"].model_copy()}) == 1
+
+
+def test_extract_triples():
+    from r2r.base.abstractions.document import (
+        extract_entities,
+        extract_triples,
+    )
+
+    payload = [
+        "[1], PERSON:Aristotle",
+        "[2], ORGANIZATION:Lyceum",
+        "[1] FOUNDED [2]",
+        "[1] BORN_IN 384 BC",
+        "[9] FOUNDED [2]",
+        "[1]",
+    ]
+    triples = extract_triples(payload, extract_entities(payload))
+    assert [(t.subject, t.predicate, t.object) for t in triples] == [
+        ("Aristotle", "FOUNDED", "Lyceum"),
+        ("Aristotle", "BORN_IN", "384 BC"),
+    ]
+
+
+def test_sync_wrappers_share_one_loop():
+    class Service(metaclass=AsyncSyncMeta):
+        @syncable
+        async def aloop(self):
+            return asyncio.get_running_loop()
+
+        @syncable
+        async def astream(self, n):
+            async def gen():
+                for i in range(n):
+                    yield i
+
+            return gen()
+
+    service = Service()
+    assert service.loop() is service.loop()
+    assert list(service.stream(3)) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_buffered_async_generator_preserves_order_and_errors():
+    async def numbers():
+        for i in range(5):
+            yield i
+        raise ValueError("boom")
+
+    received = []
+    with pytest.raises(ValueError, match="boom"):
+        async for item in buffered_async_generator(numbers(), size=2):
+            received.append(item)
+    assert received == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_bounded_gather_cancels_and_awaits_pending_on_close():
+    cancelled = []
+
+    async def job(i):
+        try:
+            await asyncio.sleep(0 if i == 0 else 10)
+            return i
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+
+    async def jobs():
+        for i in range(3):
+            yield job(i)
+
+    gen = bounded_gather(jobs(), limit=3)
+    assert await gen.__anext__() == 0
+    await gen.aclose()
+    assert sorted(cancelled) == [1, 2]
+
+
+def test_execution_wrapper_streams_rag_in_local_mode():
+    from r2r.main.execution import R2RExecutionWrapper
+
+    class App(metaclass=AsyncSyncMeta):
+        @syncable
+        async def arag(self, query, *args, **kwargs):
+            async def gen():
+                for token in ("Hello", ", ", query):
+                    yield token
+
+            return gen()
+
+    wrapper = R2RExecutionWrapper.__new__(R2RExecutionWrapper)
+    wrapper.client_mode = False
+    wrapper.app = App()
+
+    assert list(wrapper.rag("world", stream=True)) == ["Hello", ", ", "world"]
@@ -1,10 +1,14 @@
+import asyncio
 import random
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
 
 from r2r import (
+    Argon2Config,
+    Argon2Provider,
     AuthConfig,
     BCryptConfig,
     BCryptProvider,
@@ -12,6 +16,7 @@ from r2r import (
     PostgresDBProvider,
     R2RAuthProvider,
     R2RException,
+    User,
     UserCreate,
 )
 from r2r.main.services import AuthService
@@ -560,3 +565,125 @@ async def test_token_blacklist_cleanup(auth_service, auth_provider):
     assert auth_provider.db_provider.relational.is_token_blacklisted(
         access_token
     )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_is_coalesced():
+    calls = []
+
+    def refresh_access_token(user_email, refresh_token):
+        calls.append(refresh_token)
+        time.sleep(0.05)
+        return {"refresh_token": f"new-{len(calls)}"}
+
+    mock_providers = Mock()
+    mock_providers.auth.refresh_access_token = refresh_access_token
+    service = AuthService(
+        config=Mock(),
+        providers=mock_providers,
+        pipelines=Mock(),
+        run_manager=Mock(),
+        agents=Mock(),
+        logging_connection=Mock(),
+    )
+
+    results = await asyncio.gather(
+        *[
+            service.refresh_access_token("user@example.com", "token")
+            for _ in range(5)
+        ]
+    )
+    assert len(calls) == 1
+    assert all(result == {"refresh_token": "new-1"} for result in results)
+
+    await service.refresh_access_token("user@example.com", "token")
+    assert len(calls) == 2
+
+
+def test_argon2_provider_verifies_and_migrates_bcrypt_hashes():
+    pytest.importorskip("argon2")
+    argon2 = Argon2Provider(
+        Argon2Config(provider="argon2", memory_cost=1024, parallelism=1)
+    )
+
+    hashed = argon2.get_password_hash("password123")
+    assert hashed.startswith("$argon2id$")
+    assert argon2.verify_password("password123", hashed)
+    assert not argon2.verify_password("wrong", hashed)
+    assert not argon2.needs_rehash(hashed)
+
+    legacy = BCryptProvider(
+        BCryptConfig(provider="bcrypt", salt_rounds=4)
+    ).get_password_hash("password123")
+    assert argon2.verify_password("password123", legacy)
+    assert not argon2.verify_password("wrong", legacy)
+    assert argon2.needs_rehash(legacy)
+
+
+def test_user_lookup_is_cached_until_logout():
+    db_provider = Mock()
+    db_provider.relational.is_token_blacklisted.return_value = False
+    provider = R2RAuthProvider(
+        AuthConfig(
+            secret_key="test-secret",
+            access_token_lifetime_in_minutes=30,
+            refresh_token_lifetime_in_days=7,
+        ),
+        crypto_provider=Mock(),
+        db_provider=db_provider,
+    )
+    user = User(email="cached@example.com", hashed_password="hashed")
+    db_provider.relational.get_user_by_email.reset_mock()
+    db_provider.relational.get_user_by_email.return_value = user
+    token = provider.create_access_token(data={"sub": user.email})
+
+    assert provider.user(token) is user
+    assert provider.user(token) is user
+    assert db_provider.relational.get_user_by_email.call_count == 1
+
+    provider.logout(token)
+    db_provider.relational.is_token_blacklisted.return_value = True
+    with pytest.raises(R2RException) as exc_info:
+        provider.user(token)
+    assert exc_info.value.status_code == 401
+
+
+def _cached_auth_provider(**config_kwargs):
+    db_provider = Mock()
+    db_provider.relational.is_token_blacklisted.return_value = False
+    provider = R2RAuthProvider(
+        AuthConfig.create(
+            secret_key="test-secret",
+            access_token_lifetime_in_minutes=30,
+            refresh_token_lifetime_in_days=7,
+            **config_kwargs,
+        ),
+        crypto_provider=Mock(),
+        db_provider=db_provider,
+    )
+    user = User(email="cached@example.com", hashed_password="hashed")
+    db_provider.relational.get_user_by_email.reset_mock()
+    db_provider.relational.get_user_by_email.return_value = user
+    token = provider.create_access_token(data={"sub": user.email})
+    return provider, db_provider, token
+
+
+def test_cached_user_honors_logout_from_another_worker():
+    provider, db_provider, token = _cached_auth_provider()
+    provider.user(token)
+
+    # Another worker blacklisted the token; this process never saw logout
+    db_provider.relational.is_token_blacklisted.return_value = True
+    with pytest.raises(R2RException) as exc_info:
+        provider.user(token)
+    assert exc_info.value.status_code == 401
+
+
+def test_user_cache_ttl_of_zero_disables_cache():
+    provider, db_provider, token = _cached_auth_provider(
+        user_cache_ttl_seconds=0
+    )
+
+    provider.user(token)
+    provider.user(token)
+    assert db_provider.relational.get_user_by_email.call_count == 2
@@ -1,9 +1,11 @@
+import sys
 import uuid
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import Body, Depends
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.testclient import TestClient
 
@@ -316,3 +318,13 @@ async def test_user_profile(r2r_client, mock_db):
 #     # Try to login with deleted account (should fail)
 #     with pytest.raises(R2RException):
 #         r2r_client.login(**user_data)
+
+
+def test_response_class_uses_orjson_when_installed():
+    pytest.importorskip("orjson")
+    assert R2RApp._response_class() is ORJSONResponse
+
+
+def test_response_class_falls_back_without_orjson():
+    with patch.dict(sys.modules, {"orjson": None}):
+        assert R2RApp._response_class() is JSONResponse
@@ -1,4 +1,7 @@
+import json
 import random
+import sys
+from unittest.mock import patch
 
 import pytest
 from dotenv import load_dotenv
@@ -11,6 +14,7 @@ from r2r import (
     generate_id_from_label,
 )
 from r2r.providers import PostgresDBProvider
+from r2r.providers.database.vecs.client import _json_serializer
 
 load_dotenv()
 
@@ -157,3 +161,21 @@ def test_upsert(request, db_fixture):
     assert len(results) == 1
     assert results[0].id == sample_entries[0].id
     assert results[0].metadata["key"] == "new_value"
+
+
+def test_json_serializer_uses_orjson_when_installed():
+    pytest.importorskip("orjson")
+    dumps = _json_serializer()
+
+    assert dumps is not json.dumps
+    assert json.loads(dumps({"a": [1, 2.5, None], 3: "x"})) == {
+        "a": [1, 2.5, None],
+        "3": "x",
+    }
+    # orjson rejects integers wider than 64 bits; the stdlib does not
+    assert dumps({"big": 2**70}) == json.dumps({"big": 2**70})
+
+
+def test_json_serializer_falls_back_to_stdlib_without_orjson():
+    with patch.dict(sys.modules, {"orjson": None}):
+        assert _json_serializer() is json.dumps
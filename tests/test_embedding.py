@@ -1,9 +1,10 @@
 import asyncio
-from unittest.mock import patch
+import uuid
+from unittest.mock import Mock, patch
 
 import pytest
 
-from r2r import EmbeddingConfig
+from r2r import EmbeddingConfig, EmbeddingPipe, Fragment, FragmentType
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -344,3 +345,75 @@ def test_ollama_invalid_provider_initialization():
     config = EmbeddingConfig(provider="invalid_provider")
     with pytest.raises(ValueError):
         OllamaEmbeddingProvider(config)
+
+
+@pytest.mark.asyncio
+async def test_embedding_pipe_overlaps_batches_in_order():
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def async_get_embeddings(texts, stage):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        # Later batches finish first, so ordering must not follow completion
+        await asyncio.sleep(0.01 * (10 - int(texts[0])))
+        in_flight -= 1
+        return [[float(text)] for text in texts]
+
+    provider = Mock()
+    provider.config.concurrent_request_limit = 3
+    provider.async_get_embeddings = async_get_embeddings
+    pipe = EmbeddingPipe(embedding_provider=provider, embedding_batch_size=2)
+
+    async def fragments():
+        for i in range(9):
+            yield Fragment(
+                id=uuid.uuid4(),
+                type=FragmentType.TEXT,
+                data=str(i),
+                metadata={},
+                extraction_id=uuid.uuid4(),
+                document_id=uuid.uuid4(),
+            )
+
+    results = [
+        entry
+        async for entry in pipe._run_logic(
+            EmbeddingPipe.Input(message=fragments()), state=None, run_id=None
+        )
+    ]
+
+    assert [entry.vector.data[0] for entry in results] == [
+        float(i) for i in range(9)
+    ]
+    assert peak_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_embedding_pipe_embeds_repeated_chunks_once():
+    requested = []
+
+    async def async_get_embeddings(texts, stage):
+        requested.extend(texts)
+        return [[float(len(text))] for text in texts]
+
+    provider = Mock()
+    provider.async_get_embeddings = async_get_embeddings
+    pipe = EmbeddingPipe(embedding_provider=provider, embedding_batch_size=4)
+    fragments = [
+        Fragment(
+            id=uuid.uuid4(),
+            type=FragmentType.TEXT,
+            data=text,
+            metadata={},
+            extraction_id=uuid.uuid4(),
+            document_id=uuid.uuid4(),
+        )
+        for text in ["header", "body text", "header", "x"]
+    ]
+
+    vectors = await pipe.embed(fragments)
+
+    assert requested == ["header", "body text", "x"]
+    assert vectors == [[6.0], [9.0], [6.0], [1.0]]
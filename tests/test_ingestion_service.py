@@ -8,10 +8,11 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 import pytest
 from fastapi import UploadFile
 
-from r2r import R2RAgents
+from r2r import ChunkingPipe, R2RAgents
 from r2r.base import (
     Document,
     DocumentInfo,
+    Extraction,
     R2RDocumentProcessingError,
     R2RException,
     RunManager,
@@ -423,3 +424,39 @@ async def test_document_status_update_after_ingestion(
     assert len(second_call_args) == 1
     assert second_call_args[0].document_id == document.id
     assert second_call_args[0].status == "success"
+
+
+@pytest.mark.asyncio
+async def test_chunk_order_spans_extractions_of_a_document():
+    async def chunk(data):
+        for text in data.split():
+            yield text
+
+    chunking_provider = Mock()
+    chunking_provider.chunk = chunk
+    pipe = ChunkingPipe(chunking_provider=chunking_provider)
+    document_id, other_document_id = uuid.uuid4(), uuid.uuid4()
+
+    async def extractions():
+        # One extraction per page, as the PDF parser produces
+        for doc_id, data in (
+            (document_id, "a b"),
+            (other_document_id, "x"),
+            (document_id, "c d"),
+        ):
+            yield Extraction(
+                id=uuid.uuid4(), data=data, metadata={}, document_id=doc_id
+            )
+
+    fragments = [
+        fragment
+        async for fragment in pipe._run_logic(
+            ChunkingPipe.Input(message=extractions()), state=None, run_id=None
+        )
+    ]
+
+    assert [
+        (fragment.data, fragment.metadata["chunk_order"])
+        for fragment in fragments
+    ] == [("a", 0), ("b", 1), ("x", 0), ("c", 2), ("d", 3)]
+    assert len({fragment.id for fragment in fragments}) == len(fragments)
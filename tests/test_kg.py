@@ -0,0 +1,135 @@
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from r2r import Extraction, KGExtractionPipe, R2RDocumentProcessingError
+
+
+@pytest.fixture(scope="session", autouse=True)
+def event_loop_policy():
+    asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def cleanup_tasks():
+    yield
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    [task.cancel() for task in tasks]
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _completion(content):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+def _kg_pipe(aget_completion, concurrency_limit=4, kg_batch_size=2):
+    async def chunk(data):
+        for text in data.split():
+            yield text
+
+    llm_provider = Mock()
+    llm_provider.config.concurrency_limit = concurrency_limit
+    llm_provider.aget_completion = aget_completion
+    prompt_provider = Mock()
+    prompt_provider._get_message_payload = (
+        lambda task_prompt_name, task_inputs: [
+            {"role": "user", "content": task_inputs["input"]}
+        ]
+    )
+    chunking_provider = Mock()
+    chunking_provider.chunk = chunk
+    return KGExtractionPipe(
+        kg_provider=Mock(),
+        llm_provider=llm_provider,
+        prompt_provider=prompt_provider,
+        chunking_provider=chunking_provider,
+        kg_batch_size=kg_batch_size,
+    )
+
+
+@pytest.mark.asyncio
+async def test_kg_extraction_pipe_overlaps_batches_in_order():
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def aget_completion(messages, generation_config):
+        nonlocal in_flight, peak_in_flight
+        text = messages[0]["content"]
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        # Later batches finish first, so ordering must not follow completion
+        index = 2 if text == "fail" else int(text)
+        await asyncio.sleep(0.01 * (10 - index))
+        in_flight -= 1
+        if text == "fail":
+            raise RuntimeError("boom")
+        return _completion(
+            json.dumps({"entities_and_triples": [f"[1], CHUNK:{text}"]})
+        )
+
+    pipe = _kg_pipe(aget_completion)
+    documents = {uuid.uuid4(): data for data in ("0 1 fail", "3 4 5", "6 7")}
+
+    async def extractions():
+        for document_id, data in documents.items():
+            yield Extraction(
+                id=uuid.uuid4(),
+                data=data,
+                metadata={},
+                document_id=document_id,
+            )
+
+    results = [
+        result
+        async for result in pipe._run_logic(
+            KGExtractionPipe.Input(message=extractions()),
+            state=None,
+            run_id=None,
+        )
+    ]
+
+    # The failed batch spans the first two documents; both are reported
+    first, second, _ = documents
+    errors = [
+        result.document_id
+        for result in results
+        if isinstance(result, R2RDocumentProcessingError)
+    ]
+    assert errors == [first, second]
+    assert [
+        result.entities["[1]"].value
+        for result in results
+        if not isinstance(result, R2RDocumentProcessingError)
+    ] == ["0", "1", "4", "5", "6", "7"]
+    assert peak_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_extract_kg_retries_malformed_json_with_correction():
+    requests = []
+
+    async def aget_completion(messages, generation_config):
+        requests.append(messages)
+        if len(requests) == 1:
+            return _completion("not json")
+        return _completion(
+            json.dumps({"entities_and_triples": ["[1], CHUNK:text"]})
+        )
+
+    pipe = _kg_pipe(aget_completion)
+    kg_extraction = await pipe.extract_kg("text")
+
+    assert kg_extraction.entities["[1]"].value == "text"
+    assert len(requests) == 2
+    assert requests[0] == [{"role": "user", "content": "text"}]
+    assert requests[1][:2] == [
+        {"role": "user", "content": "text"},
+        {"role": "assistant", "content": "not json"},
+    ]
+    assert "malformed" in requests[1][2]["content"]
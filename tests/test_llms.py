@@ -176,3 +176,12 @@ async def test_aget_completion_stream(
             == "True"
         )
         assert all(chunk.object == "chat.completion.chunk" for chunk in chunks)
+
+
+def test_get_completion_passes_through_typed_response(
+    lite_llm, messages, generation_config
+):
+    response = LLMChatCompletion(**MockCompletionResponse("True").dict())
+    with patch.object(lite_llm, "_execute_task_sync", return_value=response):
+        completion = lite_llm.get_completion(messages, generation_config)
+        assert completion is response
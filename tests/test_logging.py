@@ -53,6 +53,38 @@ async def test_local_logging(local_provider):
     assert logs[0]["value"] == "value"
 
 
+@pytest.mark.asyncio
+async def test_local_logging_concurrent_burst(local_provider):
+    run_id = generate_run_id()
+    await asyncio.gather(
+        *[
+            local_provider.log(run_id, f"key_{i}", f"value_{i}")
+            for i in range(50)
+        ]
+    )
+    logs = await local_provider.get_logs([run_id], limit_per_run=100)
+    assert sorted(log["key"] for log in logs) == sorted(
+        f"key_{i}" for i in range(50)
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_run_info_and_logs(local_provider):
+    search_run, rag_run = generate_run_id(), generate_run_id()
+    await local_provider.log(
+        search_run, "pipeline_type", "search", is_info_log=True
+    )
+    await local_provider.log(search_run, "key", "search_value")
+    await local_provider.log(rag_run, "pipeline_type", "rag", is_info_log=True)
+    await local_provider.log(rag_run, "key", "rag_value")
+
+    run_info, logs = await local_provider.get_run_info_and_logs(
+        log_type_filter="search"
+    )
+    assert [run.run_id for run in run_info] == [search_run]
+    assert [log["value"] for log in logs] == ["search_value"]
+
+
 # FIXME: This test is causing Pytest to hang
 # @pytest.mark.asyncio
 # async def test_multiple_log_entries(local_provider):
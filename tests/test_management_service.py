@@ -0,0 +1,104 @@
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from r2r.base import AnalysisTypes, FilterCriteria
+from r2r.main.services import ManagementService
+
+
+@pytest.mark.asyncio
+async def test_analytics_routes_logs_to_matching_filters():
+    run_id = uuid.uuid4()
+    logging_connection = Mock()
+    logging_connection.get_run_info_and_logs = AsyncMock(
+        return_value=(
+            [Mock(run_id=run_id)],
+            [
+                {
+                    "log_id": str(run_id),
+                    "key": "search_latency",
+                    "value": "0.1",
+                },
+                {"log_id": str(run_id), "key": "rag_latency", "value": "0.5"},
+                {
+                    "log_id": str(run_id),
+                    "key": "search_latency",
+                    "value": "0.2",
+                },
+            ],
+        )
+    )
+    service = ManagementService(
+        Mock(), Mock(), Mock(), Mock(), Mock(), logging_connection
+    )
+
+    results = await service.aanalytics(
+        FilterCriteria(
+            filters={"search": "search_latency", "missing": "unknown_key"}
+        ),
+        AnalysisTypes(),
+    )
+
+    assert [log["value"] for log in results["filtered_logs"]["search"]] == [
+        "0.1",
+        "0.2",
+    ]
+    assert results["filtered_logs"]["missing"] == []
+
+
+@pytest.mark.asyncio
+async def test_logs_stream_yields_the_same_runs():
+    run_id = uuid.uuid4()
+    logging_connection = Mock()
+    logging_connection.get_run_info_and_logs = AsyncMock(
+        return_value=(
+            [
+                Mock(
+                    run_id=run_id,
+                    log_type="search",
+                    timestamp=None,
+                    user_id=None,
+                )
+            ],
+            [
+                {
+                    "log_id": str(run_id),
+                    "key": "b",
+                    "value": 2,
+                    "timestamp": 1,
+                },
+                {
+                    "log_id": str(run_id),
+                    "key": "a",
+                    "value": 1,
+                    "timestamp": 0,
+                },
+            ],
+        )
+    )
+    service = ManagementService(
+        Mock(), Mock(), Mock(), Mock(), Mock(), logging_connection
+    )
+
+    logs = await service.alogs()
+    streamed = await service.alogs(stream=True)
+
+    assert not isinstance(streamed, list)
+    assert list(streamed) == logs
+    assert [entry["key"] for entry in logs[0]["entries"]] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_app_settings_reflects_prompt_updates():
+    from r2r.providers.prompts import R2RPromptProvider
+
+    providers = Mock(prompt=R2RPromptProvider())
+    service = ManagementService(
+        Mock(), providers, Mock(), Mock(), Mock(), Mock()
+    )
+
+    providers.prompt.update_prompt("default_system", template="Be brief.")
+    settings = await service.aapp_settings()
+
+    assert settings["prompts"]["default_system"]["template"] == "Be brief."
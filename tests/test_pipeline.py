@@ -289,3 +289,79 @@ async def test_fan_out_then_multiply(
     assert (
         result[0] == expected_result
     ), "Pipeline output did not match expected multipliers"
+
+
+class RecordingMultiplierPipe(MultiplierPipe):
+    async def _run_logic(self, input, state, run_id=None, *args, **kwargs):
+        outputs = []
+        async for item in super()._run_logic(input, state, run_id):
+            outputs.append(item)
+            yield item
+        await state.update(self.config.name, {"output": {"total": outputs}})
+
+
+class OffsetPipe(AsyncPipe):
+    class Input(AsyncPipe.Input):
+        offset: list[int] = []
+
+    def __init__(self, name="offset_pipe"):
+        super().__init__(
+            type=PipeType.OTHER,
+            config=self.PipeConfig(name=name),
+        )
+
+    async def _run_logic(
+        self, input, state, run_id=None, *args, **kwargs
+    ) -> AsyncGenerator[Any, None]:
+        async for item in input.message:
+            yield item + sum(input.offset)
+
+
+@pytest.mark.asyncio
+async def test_upstream_output_from_earlier_pipe():
+    async def input_generator():
+        for i in [1, 2, 3]:
+            yield i
+
+    pipeline = AsyncPipeline()
+    pipeline.add_pipe(RecordingMultiplierPipe(multiplier=2, name="pipe_a"))
+    pipeline.add_pipe(MultiplierPipe(multiplier=3, name="pipe_b"))
+    pipeline.add_pipe(
+        OffsetPipe(name="pipe_c"),
+        add_upstream_outputs=[
+            {
+                "prev_pipe_name": "pipe_a",
+                "prev_output_field": "total",
+                "input_field": "offset",
+            }
+        ],
+    )
+
+    result = await pipeline.run(input_generator())
+
+    # pipe_b must still see every item produced by pipe_a
+    assert result == [6 + 12, 12 + 12, 18 + 12]
+
+
+@pytest.mark.asyncio
+async def test_upstream_output_shared_by_multiple_pipes():
+    async def input_generator():
+        for i in [1, 2, 3]:
+            yield i
+
+    upstream = [
+        {
+            "prev_pipe_name": "pipe_a",
+            "prev_output_field": "total",
+            "input_field": "offset",
+        }
+    ]
+    pipeline = AsyncPipeline()
+    pipeline.add_pipe(RecordingMultiplierPipe(multiplier=2, name="pipe_a"))
+    pipeline.add_pipe(OffsetPipe(name="pipe_b"), add_upstream_outputs=upstream)
+    pipeline.add_pipe(OffsetPipe(name="pipe_c"), add_upstream_outputs=upstream)
+
+    result = await pipeline.run(input_generator())
+
+    # Both consumers see pipe_a's output without draining it twice
+    assert result == [2 + 24, 4 + 24, 6 + 24]
@@ -0,0 +1,45 @@
+import uuid
+from unittest.mock import Mock
+
+import httpx
+
+from r2r.base import VectorSearchSettings
+from r2r.main.services import RetrievalService
+
+
+def test_scope_search_filters_does_not_mutate_settings():
+    document_id = uuid.uuid4()
+    settings = VectorSearchSettings(
+        search_filters={"document_id": document_id}
+    )
+    user = Mock(id=uuid.uuid4(), is_superuser=False)
+
+    scoped = RetrievalService._scope_search_filters(settings, user)
+
+    assert scoped.search_filters == {
+        "document_id": str(document_id),
+        "user_id": str(user.id),
+    }
+    assert settings.search_filters == {"document_id": document_id}
+
+
+def test_scope_search_filters_leaves_superusers_unscoped():
+    settings = VectorSearchSettings()
+    user = Mock(id=uuid.uuid4(), is_superuser=True)
+
+    scoped = RetrievalService._scope_search_filters(settings, user)
+
+    assert scoped.search_filters == {}
+
+
+def test_pipeline_error_maps_wrapped_connection_failures_to_502():
+    try:
+        try:
+            raise httpx.ConnectError("connection refused")
+        except httpx.ConnectError as e:
+            raise ValueError("completion failed") from e
+    except ValueError as wrapped:
+        error = RetrievalService._pipeline_error(wrapped)
+
+    assert error.status_code == 502
+    assert RetrievalService._pipeline_error(KeyError()).status_code == 500